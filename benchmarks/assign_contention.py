@@ -0,0 +1,97 @@
+"""
+Contention benchmark of `PATCH /missions/{mission_id}/assign`: many concurrent assigns competing for a few cats.
+
+Creates `--cats` cats and `--missions` open missions, then sends `--requests` assigns of a random cat to a random
+mission from `--concurrency` concurrent clients. Every request must be answered with 200 or 400 (the cat already
+has an active mission) and no cat may end up with more than one active mission. Prints throughput, latency and
+status counts as JSON and exits 1 on a violation:
+
+    uv run python -m benchmarks.assign_contention --cats 20 --missions 500 --requests 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from httpx import AsyncClient
+
+from benchmarks.harness import STUB_BREEDS, bench_client
+
+
+async def seed(client: AsyncClient, cats: int, missions: int) -> tuple[list[int], list[int]]:
+    response = await client.post(
+        '/cats/bulk',
+        json=[
+            {'name': f'Cat {i}', 'breed': STUB_BREEDS[0].name, 'salary': 1000, 'years_of_experience': 1}
+            for i in range(cats)
+        ],
+    )
+    response.raise_for_status()
+    cat_ids = response.json()['created_ids']
+    response = await client.post(
+        '/missions/bulk', json=[{'targets': [{'name': 'Target', 'country': 'UA'}]} for _ in range(missions)]
+    )
+    response.raise_for_status()
+    return cat_ids, response.json()['created_ids']
+
+
+async def main(args: argparse.Namespace) -> int:
+    random.seed(args.seed)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / 'bench.db'
+        async with bench_client(db_path) as client:
+            cat_ids, mission_ids = await seed(client, args.cats, args.missions)
+            pending = iter([(random.choice(mission_ids), random.choice(cat_ids)) for _ in range(args.requests)])
+            statuses: Counter[int] = Counter()
+            latencies: list[float] = []
+
+            async def worker() -> None:
+                for mission_id, cat_id in pending:
+                    started = time.perf_counter()
+                    response = await client.patch(f'/missions/{mission_id}/assign', json={'cat_id': cat_id})
+                    latencies.append(time.perf_counter() - started)
+                    statuses[response.status_code] += 1
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+            elapsed = time.perf_counter() - started
+
+        with sqlite3.connect(db_path) as connection:
+            doubly_assigned = connection.execute(
+                'SELECT cat_id, COUNT(*) FROM missions WHERE cat_id IS NOT NULL AND NOT completed '
+                'GROUP BY cat_id HAVING COUNT(*) > 1'
+            ).fetchall()
+
+    violations = [f'HTTP {status}: {count} requests' for status, count in statuses.items() if status not in {200, 400}]
+    violations += [f'cat {cat_id}: {count} active missions' for cat_id, count in doubly_assigned]
+    quantiles = statistics.quantiles(latencies, n=100)
+    report = {
+        'requests': len(latencies),
+        'concurrency': args.concurrency,
+        'statuses': {str(status): count for status, count in sorted(statuses.items())},
+        'requests_per_second': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(quantiles[49] * 1000, 2),
+        'p95_ms': round(quantiles[94] * 1000, 2),
+        'p99_ms': round(quantiles[98] * 1000, 2),
+        'violations': violations,
+    }
+    print(json.dumps(report, indent=2))  # noqa: T201
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--cats', type=int, default=20)
+    parser.add_argument('--missions', type=int, default=500)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    sys.exit(asyncio.run(main(parser.parse_args())))
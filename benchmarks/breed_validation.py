@@ -0,0 +1,60 @@
+"""
+Breed validation cost per `POST /cats`: set union rebuilt on every call vs the precomputed BreedIndex.
+
+    uv run python -m benchmarks.breed_validation --breeds 70 --number 100000
+"""
+
+import argparse
+import itertools
+import json
+import timeit
+
+from src.repositories.rest_api.structures import CatBreed
+from src.services.breeds import BreedIndex
+
+
+def make_breeds(count: int) -> list[CatBreed]:
+    return [
+        CatBreed(
+            id=f'b{i:03}',
+            name=f'Breed {i}',
+            alt_names=f'Alt {i}, Other Name {i}',
+            weight={'imperial': '7 - 10', 'metric': '3 - 5'},
+        )
+        for i in range(count)
+    ]
+
+
+def union_lookup(breeds: list[CatBreed], name: str) -> bool:
+    """What CatSpyService.create used to do on every call."""
+    allowed_cat_breeds = {breed.name for breed in breeds}
+    allowed_alternative_breeds = set(itertools.chain.from_iterable(breed.alt_names for breed in breeds))
+    return name in allowed_cat_breeds | allowed_alternative_breeds
+
+
+def main(breed_count: int, number: int) -> None:
+    breeds = make_breeds(breed_count)
+    index = BreedIndex(breeds)
+    name = f'Other Name {breed_count - 1}'
+    assert union_lookup(breeds, name)
+    assert index.resolve(name) is not None
+
+    union_seconds = timeit.timeit(lambda: union_lookup(breeds, name), number=number)
+    index_seconds = timeit.timeit(lambda: index.resolve(name), number=number)
+    build_seconds = timeit.timeit(lambda: BreedIndex(breeds), number=100) / 100
+    report = {
+        'breeds': breed_count,
+        'lookups': number,
+        'set_union_us_per_lookup': round(union_seconds / number * 1e6, 3),
+        'index_us_per_lookup': round(index_seconds / number * 1e6, 3),
+        'index_build_ms_per_refresh': round(build_seconds * 1000, 3),
+    }
+    print(json.dumps(report, indent=2))  # noqa: T201
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--breeds', type=int, default=70)
+    parser.add_argument('--number', type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.breeds, args.number)
@@ -0,0 +1,78 @@
+"""
+Throughput of `POST /cats/bulk` vs one `POST /cats` per row, in-process against a throwaway SQLite database.
+
+    uv run python -m benchmarks.bulk_import --rows 50000
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.harness import STUB_BREEDS, bench_client
+
+
+def make_rows(count: int) -> list[dict]:
+    return [
+        {
+            'name': f'Cat {i}',
+            'breed': STUB_BREEDS[i % len(STUB_BREEDS)].alt_names[0],
+            'salary': 1000 + i % 500,
+            'years_of_experience': i % 20,
+        }
+        for i in range(count)
+    ]
+
+
+async def single_inserts(rows: list[dict]) -> float:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        async with bench_client(Path(tmp_dir) / 'single.db') as client:
+            started = time.perf_counter()
+            for row in rows:
+                response = await client.post('/cats', json=row)
+                response.raise_for_status()
+            return time.perf_counter() - started
+
+
+async def bulk_import(rows: list[dict], *, ndjson: bool) -> float:
+    if ndjson:
+        kwargs = {
+            'content': '\n'.join(json.dumps(row) for row in rows),
+            'headers': {'content-type': 'application/x-ndjson'},
+        }
+    else:
+        kwargs = {'json': rows}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        async with bench_client(Path(tmp_dir) / 'bulk.db') as client:
+            started = time.perf_counter()
+            response = await client.post('/cats/bulk', **kwargs)
+            elapsed = time.perf_counter() - started
+            response.raise_for_status()
+            assert len(response.json()['created_ids']) == len(rows)
+            return elapsed
+
+
+async def main(row_count: int, single_row_count: int) -> None:
+    rows = make_rows(row_count)
+    single_seconds = await single_inserts(rows[:single_row_count])
+    json_seconds = await bulk_import(rows, ndjson=False)
+    ndjson_seconds = await bulk_import(rows, ndjson=True)
+    report = {
+        'rows': row_count,
+        'rows_per_second': {
+            'post_cats_one_by_one': round(single_row_count / single_seconds),
+            'bulk_json_array': round(row_count / json_seconds),
+            'bulk_ndjson': round(row_count / ndjson_seconds),
+        },
+    }
+    print(json.dumps(report, indent=2))  # noqa: T201
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=50_000)
+    parser.add_argument('--single-rows', type=int, default=500, help='rows sent one request at a time')
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.single_rows))
@@ -0,0 +1,287 @@
+"""
+Load benchmark of every endpoint, in-process through an ASGI transport with TheCatAPI stubbed.
+
+Seeds a throwaway SQLite database with `--cats` cats and `--missions` missions (1-3 targets each, every other one
+of the first missions assigned), then sends `--requests` requests per endpoint from `--concurrency` concurrent
+clients. Resources consumed by an endpoint (cats to delete, missions to assign...) are created before its timer
+starts. Prints throughput and latency percentiles per endpoint as JSON, tagged with the current commit so runs can
+be compared:
+
+    uv run python -m benchmarks.endpoints --cats 10000 --missions 5000 --requests 1000 --output before.json
+    uv run python -m benchmarks.endpoints --endpoint "GET /cats" --endpoint "GET /missions"
+"""
+
+# request builders share one signature, not all of them need the dataset
+# ruff: noqa: ARG001
+
+import argparse
+import asyncio
+import json
+import random
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from httpx import AsyncClient
+
+from benchmarks.harness import STUB_BREEDS, bench_client
+
+
+type BenchRequest = tuple[str, str, object]
+type RequestsBuilder = Callable[['Dataset', int], Awaitable[list[BenchRequest]]]
+
+BULK_CATS_PER_REQUEST = 100
+BULK_MISSIONS_PER_REQUEST = 20
+BATCH_IDS_PER_REQUEST = 20
+
+
+def make_cat(i: int) -> dict:
+    return {
+        'name': f'Cat {i}',
+        'breed': STUB_BREEDS[i % len(STUB_BREEDS)].name,
+        'salary': 1000 + i % 500,
+        'years_of_experience': i % 20,
+    }
+
+
+def make_mission(i: int) -> dict:
+    return {
+        'targets': [
+            {'name': f'Target {i}.{n}', 'country': 'UA', 'notes': 'Seen at the harbour' if n % 2 else None}
+            for n in range(1 + i % 3)
+        ]
+    }
+
+
+class Dataset:
+    """The seeded database and helpers to create extra rows for endpoints that consume them."""
+
+    def __init__(self, client: AsyncClient, db_path: Path):
+        self.client = client
+        self.db_path = db_path
+        self.cat_ids: list[int] = []
+        self.mission_ids: list[int] = []
+
+    async def seed(self, cats: int, missions: int) -> None:
+        self.cat_ids = await self.create_cats(cats)
+        self.mission_ids = await self.create_missions(missions)
+        # assign every other one of the first missions, one active mission per cat
+        assigned = list(zip(self.mission_ids[: len(self.cat_ids) : 2], self.cat_ids[::2], strict=False))
+        with sqlite3.connect(self.db_path) as connection:
+            connection.executemany('UPDATE missions SET cat_id = ? WHERE id = ?', [(c, m) for m, c in assigned])
+
+    async def create_cats(self, count: int) -> list[int]:
+        ids = []
+        for start in range(0, count, 10_000):
+            response = await self.client.post(
+                '/cats/bulk', json=[make_cat(i) for i in range(start, min(start + 10_000, count))]
+            )
+            response.raise_for_status()
+            ids.extend(response.json()['created_ids'])
+        return ids
+
+    async def create_missions(self, count: int) -> list[int]:
+        ids = []
+        for start in range(0, count, 5_000):
+            response = await self.client.post(
+                '/missions/bulk', json=[make_mission(i) for i in range(start, min(start + 5_000, count))]
+            )
+            response.raise_for_status()
+            ids.extend(response.json()['created_ids'])
+        return ids
+
+    def open_targets(self) -> list[tuple[int, int]]:
+        with sqlite3.connect(self.db_path) as connection:
+            return connection.execute(
+                'SELECT targets.mission_id, targets.id FROM targets JOIN missions ON missions.id = targets.mission_id '
+                'WHERE NOT targets.completed AND NOT missions.completed'
+            ).fetchall()
+
+
+async def list_cats(dataset: Dataset, count: int) -> list[BenchRequest]:
+    pages = max(len(dataset.cat_ids) // 20, 1)
+    return [('GET', f'/cats?limit=20&offset={random.randrange(pages) * 20}', None) for _ in range(count)]
+
+
+async def list_cats_cursor(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('GET', '/cats?limit=20&cursor=', None)] * count
+
+
+async def get_cat(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('GET', f'/cats/{random.choice(dataset.cat_ids)}', None) for _ in range(count)]
+
+
+def random_ids(ids: list[int]) -> str:
+    return ','.join(map(str, random.sample(ids, BATCH_IDS_PER_REQUEST)))
+
+
+async def batch_get_cats(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('GET', f'/cats?ids={random_ids(dataset.cat_ids)}', None) for _ in range(count)]
+
+
+async def create_cat(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('POST', '/cats', make_cat(i)) for i in range(count)]
+
+
+async def bulk_create_cats(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('POST', '/cats/bulk', [make_cat(i) for i in range(BULK_CATS_PER_REQUEST)])] * count
+
+
+async def update_cat(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('PATCH', f'/cats/{random.choice(dataset.cat_ids)}', {'salary': 1000 + i}) for i in range(count)]
+
+
+async def delete_cat(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('DELETE', f'/cats/{cat_id}', None) for cat_id in await dataset.create_cats(count)]
+
+
+async def list_missions(dataset: Dataset, count: int) -> list[BenchRequest]:
+    pages = max(len(dataset.mission_ids) // 20, 1)
+    return [('GET', f'/missions?limit=20&offset={random.randrange(pages) * 20}', None) for _ in range(count)]
+
+
+async def list_missions_with_targets(dataset: Dataset, count: int) -> list[BenchRequest]:
+    pages = max(len(dataset.mission_ids) // 20, 1)
+    return [
+        ('GET', f'/missions?limit=20&offset={random.randrange(pages) * 20}&include=targets', None) for _ in range(count)
+    ]
+
+
+async def get_mission(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('GET', f'/missions/{random.choice(dataset.mission_ids)}', None) for _ in range(count)]
+
+
+async def batch_get_missions(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('GET', f'/missions?include=targets&ids={random_ids(dataset.mission_ids)}', None) for _ in range(count)]
+
+
+async def create_mission(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('POST', '/missions', make_mission(i)) for i in range(count)]
+
+
+async def bulk_create_missions(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('POST', '/missions/bulk', [make_mission(i) for i in range(BULK_MISSIONS_PER_REQUEST)])] * count
+
+
+async def assign_cat(dataset: Dataset, count: int) -> list[BenchRequest]:
+    pairs = zip(await dataset.create_missions(count), await dataset.create_cats(count), strict=True)
+    return [('PATCH', f'/missions/{mission_id}/assign', {'cat_id': cat_id}) for mission_id, cat_id in pairs]
+
+
+async def delete_mission(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('DELETE', f'/missions/{mission_id}', None) for mission_id in await dataset.create_missions(count)]
+
+
+async def update_target(dataset: Dataset, count: int) -> list[BenchRequest]:
+    targets = dataset.open_targets()
+    return [
+        ('PATCH', f'/missions/{mission_id}/targets/{target_id}', {'notes': f'Report {i}'})
+        for i, (mission_id, target_id) in enumerate(random.choices(targets, k=count))
+    ]
+
+
+async def get_metrics(dataset: Dataset, count: int) -> list[BenchRequest]:
+    return [('GET', '/metrics', None)] * count
+
+
+ENDPOINTS: dict[str, RequestsBuilder] = {
+    'GET /cats': list_cats,
+    'GET /cats?cursor': list_cats_cursor,
+    'GET /cats/{cat_id}': get_cat,
+    'GET /cats?ids': batch_get_cats,
+    'POST /cats': create_cat,
+    'POST /cats/bulk': bulk_create_cats,
+    'PATCH /cats/{cat_id}': update_cat,
+    'GET /missions': list_missions,
+    'GET /missions?include=targets': list_missions_with_targets,
+    'GET /missions/{mission_id}': get_mission,
+    'GET /missions?ids&include=targets': batch_get_missions,
+    'POST /missions': create_mission,
+    'POST /missions/bulk': bulk_create_missions,
+    'PATCH /missions/{mission_id}/assign': assign_cat,
+    'PATCH /missions/{mission_id}/targets/{target_id}': update_target,
+    'DELETE /missions/{mission_id}': delete_mission,
+    'DELETE /cats/{cat_id}': delete_cat,
+    'GET /metrics': get_metrics,
+}
+
+
+async def drive(client: AsyncClient, requests: list[BenchRequest], concurrency: int) -> dict:
+    pending = iter(requests)
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for method, url, payload in pending:
+            started = time.perf_counter()
+            response = await client.request(method, url, json=payload)
+            latencies.append(time.perf_counter() - started)
+            if response.is_error:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'requests_per_second': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(quantiles[49] * 1000, 3),
+        'p95_ms': round(quantiles[94] * 1000, 3),
+        'p99_ms': round(quantiles[98] * 1000, 3),
+    }
+
+
+def current_commit() -> str | None:
+    result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=False)
+    return result.stdout.strip() or None
+
+
+async def main(args: argparse.Namespace) -> None:
+    random.seed(args.seed)
+    selected = args.endpoint or list(ENDPOINTS)
+    unknown = set(selected) - set(ENDPOINTS)
+    if unknown:
+        raise SystemExit(f'Unknown endpoints: {", ".join(sorted(unknown))}')
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / 'bench.db'
+        async with bench_client(db_path) as client:
+            dataset = Dataset(client, db_path)
+            await dataset.seed(args.cats, args.missions)
+            for name in selected:
+                requests = await ENDPOINTS[name](dataset, args.concurrency + args.requests)
+                await drive(client, requests[: args.concurrency], args.concurrency)  # warm-up
+                results[name] = await drive(client, requests[args.concurrency :], args.concurrency)
+
+    report = {
+        'commit': current_commit(),
+        'dataset': {'cats': args.cats, 'missions': args.missions},
+        'requests_per_endpoint': args.requests,
+        'concurrency': args.concurrency,
+        'endpoints': results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    print(output)  # noqa: T201
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--cats', type=int, default=10_000)
+    parser.add_argument('--missions', type=int, default=5_000)
+    parser.add_argument('--requests', type=int, default=500, help='requests per endpoint')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--endpoint', action='append', help='only run this endpoint (repeatable)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for picking ids')
+    parser.add_argument('--output', type=Path, help='also write the report to this file')
+    asyncio.run(main(parser.parse_args()))
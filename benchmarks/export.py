@@ -0,0 +1,143 @@
+"""
+Full-table download: paging `GET /cats` 100 rows at a time vs streaming `GET /cats/export`.
+
+Seeds `--rows` cats and missions (with targets) with the seed tool's generators, then reads every row through the
+API. Memory is reported as the tracemalloc peak of an export run, which should not grow with `--rows`; that run
+drives the ASGI app directly, because httpx's ASGI transport buffers the whole response body.
+
+    uv run python -m benchmarks.export --rows 100000
+"""
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks.harness import bench_app
+from src.tools.seed import generate_cats, generate_missions, generate_targets
+
+
+def seed(db_path: Path, rows: int) -> None:
+    with sqlite3.connect(db_path) as connection:
+        connection.executemany(
+            'INSERT INTO spy_cats (id, name, years_of_experience, breed, salary) '
+            'VALUES (:id, :name, :years_of_experience, :breed, :salary)',
+            generate_cats(rows, first_id=1),
+        )
+        connection.executemany(
+            'INSERT INTO missions (id, completed, cat_id) VALUES (:id, :completed, :cat_id)',
+            generate_missions(rows, first_id=1, cat_ids=range(1, rows + 1)),
+        )
+        connection.executemany(
+            'INSERT INTO targets (id, mission_id, name, country, notes, completed) '
+            'VALUES (:id, :mission_id, :name, :country, :notes, :completed)',
+            generate_targets(range(1, rows + 1), first_id=1),
+        )
+
+
+async def read_pages(client: AsyncClient, url: str) -> int:
+    rows = 0
+    while url:
+        response = await client.get(url)
+        response.raise_for_status()
+        page = response.json()
+        rows += len(page['results'])
+        url = page['next_url']
+    return rows
+
+
+async def read_export(client: AsyncClient, url: str) -> int:
+    rows = 0
+    async with client.stream('GET', url) as response:
+        response.raise_for_status()
+        async for _ in response.aiter_lines():
+            rows += 1
+    return rows
+
+
+async def timed(read, client: AsyncClient, url: str) -> dict:
+    started = time.perf_counter()
+    rows = await read(client, url)
+    elapsed = time.perf_counter() - started
+    return {'rows': rows, 'seconds': round(elapsed, 3), 'rows_per_second': round(rows / elapsed)}
+
+
+async def export_peak_memory(app: FastAPI, path: str, query_string: str = '') -> float:
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'server': ('bench', 80),
+        'client': ('127.0.0.1', 50000),
+        'root_path': '',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query_string.encode(),
+        'headers': [(b'host', b'bench')],
+    }
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive() -> dict:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message: dict) -> None:
+        # drop the body as it arrives, like a client writing it to disk
+        if message['type'] == 'http.response.body' and not message.get('more_body'):
+            disconnected.set()
+
+    tracemalloc.start()
+    try:
+        await app(scope, receive, send)
+        return round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+    finally:
+        tracemalloc.stop()
+
+
+async def main(rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / 'bench.db'
+        async with (
+            bench_app(db_path) as app,
+            AsyncClient(transport=ASGITransport(app=app), base_url='http://bench') as client,
+        ):
+            seed(db_path, rows)
+            report = {
+                'rows': rows,
+                'cats': {
+                    'offset_pages': await timed(read_pages, client, '/cats?limit=100'),
+                    'cursor_pages': await timed(read_pages, client, '/cats?limit=100&cursor='),
+                    'export': await timed(read_export, client, '/cats/export'),
+                    'export_peak_memory_mib': await export_peak_memory(app, '/cats/export'),
+                },
+                'missions': {
+                    'offset_pages': await timed(read_pages, client, '/missions?limit=100'),
+                    'export': await timed(read_export, client, '/missions/export'),
+                    'export_with_targets': await timed(read_export, client, '/missions/export?include=targets'),
+                    'export_with_targets_peak_memory_mib': await export_peak_memory(
+                        app, '/missions/export', 'include=targets'
+                    ),
+                },
+            }
+    print(json.dumps(report, indent=2))  # noqa: T201
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000, help='cats and missions to seed')
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
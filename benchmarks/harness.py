@@ -0,0 +1,91 @@
+"""Shared helpers to run the application in-process against a throwaway database with TheCatAPI stubbed."""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.dependencies.db import create_db_engine, get_db_read_session, get_db_session
+from src.main import get_app
+from src.models.cats import Base
+from src.repositories.rest_api.structures import BreedCatalogSnapshot, CatBreed
+from src.services.breeds import BreedCatalogService
+from src.settings import config
+from src.utils.sqlite import to_read_only_url
+
+
+STUB_BREEDS = [
+    CatBreed(
+        id=f'b{i:03}',
+        name=f'Breed {i}',
+        alt_names=f'Alt {i}, Other Name {i}',
+        weight={'imperial': '7 - 10', 'metric': '3 - 5'},
+    )
+    for i in range(70)
+]
+
+
+async def fetch_stub_snapshot(etag: str | None) -> BreedCatalogSnapshot | None:
+    if etag == 'stub':
+        return None
+    return BreedCatalogSnapshot(version='stub', etag='stub', fetched_at=datetime.now(UTC), breeds=STUB_BREEDS)
+
+
+@asynccontextmanager
+async def bench_app(db_path: Path, *, read_pool: bool = True) -> AsyncIterator[FastAPI]:
+    """
+    A fresh app instance whose database lives at `db_path`.
+
+    With `read_pool=False` read-only endpoints share the writers' connection pool, like before the split.
+    """
+    db_url = f'sqlite+aiosqlite:///{db_path}'
+    engine = create_db_engine(
+        db_url, name='primary', pool_size=config.db_pool_size, max_overflow=config.db_max_overflow
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    read_engine = create_db_engine(
+        to_read_only_url(db_url),
+        name='read_only',
+        read_only=True,
+        pool_size=config.db_read_pool_size,
+        max_overflow=config.db_max_overflow,
+    )
+    read_session_maker = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def get_bench_db_session() -> AsyncIterator[AsyncSession]:
+        async with session_maker() as session:
+            yield session
+
+    async def get_bench_db_read_session() -> AsyncIterator[AsyncSession]:
+        async with read_session_maker() as session:
+            yield session
+
+    breed_catalog = BreedCatalogService(fetch_stub_snapshot, ttl=3600, refresh_ahead=60, retry_interval=60)
+    await breed_catalog.start()
+
+    app = get_app()
+    app.dependency_overrides[get_db_session] = get_bench_db_session
+    app.dependency_overrides[get_db_read_session] = get_bench_db_read_session if read_pool else get_bench_db_session
+    app.state.breed_catalog = breed_catalog
+    try:
+        yield app
+    finally:
+        await breed_catalog.stop()
+        await engine.dispose()
+        await read_engine.dispose()
+
+
+@asynccontextmanager
+async def bench_client(db_path: Path, *, read_pool: bool = True) -> AsyncIterator[AsyncClient]:
+    """An HTTP client bound to a fresh app instance whose database lives at `db_path`, see `bench_app`."""
+    async with (
+        bench_app(db_path, read_pool=read_pool) as app,
+        AsyncClient(transport=ASGITransport(app=app), base_url='http://bench') as client,
+    ):
+        yield client
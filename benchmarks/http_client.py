@@ -0,0 +1,109 @@
+"""
+Per-request latency of TheCatApiRepository with a fresh client per request vs the shared app-lifetime client.
+
+Runs against a local stub of TheCatAPI, so the numbers show connection setup cost only
+(against the real API every fresh client also pays for DNS and a TLS handshake).
+
+    uv run python -m benchmarks.http_client --requests 500
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import time
+
+import uvicorn
+
+from src.dependencies.http import create_http_client
+from src.repositories.rest_api.breads_api import TheCatApiRepository
+from src.settings import config
+
+
+BREEDS = [
+    {
+        'id': f'b{i:03}',
+        'name': f'Breed {i}',
+        'alt_names': f'Alt {i}, Other {i}',
+        'weight': {'imperial': '7 - 10', 'metric': '3 - 5'},
+    }
+    for i in range(70)
+]
+
+
+async def stub_app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        while (await receive())['type'] != 'lifespan.shutdown':
+            await send({'type': 'lifespan.startup.complete'})
+        await send({'type': 'lifespan.shutdown.complete'})
+        return
+    body = json.dumps(BREEDS).encode()
+    await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'application/json')]})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def fetch_breeds(client) -> None:
+    await TheCatApiRepository(client).get_all_breds()
+
+
+async def per_request_client(requests: int) -> list[float]:
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        async with create_http_client() as client:
+            await fetch_breeds(client)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+async def shared_client(requests: int) -> list[float]:
+    timings = []
+    async with create_http_client() as client:
+        for _ in range(requests):
+            started = time.perf_counter()
+            await fetch_breeds(client)
+            timings.append(time.perf_counter() - started)
+    return timings
+
+
+def summary(timings: list[float]) -> dict:
+    quantiles = statistics.quantiles(timings, n=100)
+    return {
+        'mean_ms': round(statistics.fmean(timings) * 1000, 3),
+        'p50_ms': round(quantiles[49] * 1000, 3),
+        'p95_ms': round(quantiles[94] * 1000, 3),
+    }
+
+
+async def main(requests: int) -> None:
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(stub_app, host='127.0.0.1', port=port, log_level='warning'))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:  # noqa: ASYNC110
+        await asyncio.sleep(0.01)
+
+    config.the_cat_api_url = f'http://127.0.0.1:{port}'
+    try:
+        report = {
+            'requests': requests,
+            'per_request_client': summary(await per_request_client(requests)),
+            'shared_client': summary(await shared_client(requests)),
+        }
+    finally:
+        server.should_exit = True
+        await server_task
+    print(json.dumps(report, indent=2))  # noqa: T201
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
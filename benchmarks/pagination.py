@@ -0,0 +1,89 @@
+"""
+Offset vs keyset (cursor) pagination latency at increasing page depth.
+
+Seeds a throwaway SQLite database with `--rows` cats and times `CatSpyRepository` page queries:
+`offset_plus_count` is the former list path (separate COUNT(*) before every page), `offset` and `cursor`
+derive `next_url` from one extra row, `*_with_total` add the exact total to the same statement.
+
+    uv run python -m benchmarks.pagination --rows 1000000 --limit 20
+"""
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.models.cats import Base
+from src.repositories.sql_repos.cats import CatSpyRepository
+from src.structures import CursorPaginationParams, LimitOffsetImplPaginationParams
+
+
+PAGES = (1, 1_000, 10_000)
+
+
+def seed(db_path: Path, rows: int) -> None:
+    with sqlite3.connect(db_path) as connection:
+        connection.executemany(
+            'INSERT INTO spy_cats (id, name, years_of_experience, breed, salary) VALUES (?, ?, ?, ?, ?)',
+            ((i, f'Cat {i}', i % 20, 'Bengal', 1000.0 + i % 500) for i in range(1, rows + 1)),
+        )
+
+
+async def time_page(session: AsyncSession, pagination_params, repeat: int, *, with_count: bool = False) -> float:
+    repository = CatSpyRepository(session)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        if with_count:
+            await repository.get_count()
+        await repository.get_paginated(pagination_params=pagination_params)
+        timings.append(time.perf_counter() - started)
+        session.expunge_all()
+    return round(statistics.median(timings) * 1000, 3)
+
+
+async def main(rows: int, limit: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / 'pagination.db'
+        engine = create_async_engine(f'sqlite+aiosqlite:///{db_path}')
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        seed(db_path, rows)
+
+        report = {'rows': rows, 'limit': limit, 'median_ms': {}}
+        async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+            for page in PAGES:
+                skipped = (page - 1) * limit
+                if skipped >= rows:
+                    continue
+                offset_params = LimitOffsetImplPaginationParams(limit=limit, offset=skipped)
+                # the cursor a client would hold after reading `skipped` rows
+                cursor_params = CursorPaginationParams(limit=limit, after_id=skipped or None)
+                report['median_ms'][f'page_{page}'] = {
+                    'offset_plus_count': await time_page(session, offset_params, repeat, with_count=True),
+                    'offset': await time_page(session, offset_params, repeat),
+                    'offset_with_total': await time_page(
+                        session, offset_params.model_copy(update={'with_total': True}), repeat
+                    ),
+                    'cursor': await time_page(session, cursor_params, repeat),
+                    'cursor_with_total': await time_page(
+                        session, cursor_params.model_copy(update={'with_total': True}), repeat
+                    ),
+                }
+        await engine.dispose()
+    print(json.dumps(report, indent=2))  # noqa: T201
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.limit, args.repeat))
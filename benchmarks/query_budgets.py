@@ -0,0 +1,109 @@
+"""
+Query budget gate: drive every endpoint once with `QUERY_BUDGET_MODE=raise` and fail on a round-trip regression.
+
+`BUDGETS` holds the number of SQL statements each route needs today; lower a budget when a change removes round
+trips. Any request above its budget, or repeating one statement shape (N+1), is reported and the script exits 1.
+Bulk imports are then run once more under the default budget with one row per chunk, so their statements outnumber
+it: they must still succeed, being exempt from it.
+
+    uv run python -m benchmarks.query_budgets
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from httpx import AsyncClient
+
+from src.errors.queries import QueryBudgetExceededError
+from src.settings import config
+
+
+BUDGETS = {
+    'POST /cats': 1,
+    'POST /cats/bulk': 1,
+    'GET /cats': 1,
+    'GET /cats/{cat_id}': 1,
+    'PATCH /cats/{cat_id}': 3,
+    'DELETE /cats/{cat_id}': 1,
+    'POST /missions': 2,
+    'POST /missions/bulk': 2,  # one multi-row INSERT per chunk of missions and one per chunk of targets
+    'GET /missions': 2,  # one more with include=targets, for the targets of every listed mission
+    'GET /missions/{mission_id}': 2,
+    'PATCH /missions/{mission_id}/assign': 1,
+    'DELETE /missions/{mission_id}': 1,
+    'PATCH /missions/{mission_id}/targets/{target_id}': 2,
+}
+
+
+def large_imports(breed: str, rows: int) -> list[tuple[str, str, object]]:
+    cat = {'name': 'Tom', 'breed': breed, 'salary': 1000, 'years_of_experience': 3}
+    mission = {'targets': [{'name': 'Target 1', 'country': 'UA'}]}
+    return [('POST', '/cats/bulk', [cat] * rows), ('POST', '/missions/bulk', [mission] * rows)]
+
+
+def scenario(breed: str) -> list[tuple[str, str, object]]:
+    cat = {'name': 'Tom', 'breed': breed, 'salary': 1000, 'years_of_experience': 3}
+    mission = {'targets': [{'name': 'Target 1', 'country': 'UA'}, {'name': 'Target 2', 'country': 'PL'}]}
+    return [
+        ('POST', '/cats', cat),
+        ('POST', '/cats/bulk', [cat] * 10),
+        ('GET', '/cats', None),
+        ('GET', '/cats?cursor=&with_total=true', None),
+        ('GET', '/cats?ids=3,1,2', None),
+        ('GET', '/cats/1', None),
+        ('PATCH', '/cats/1', {'salary': 1500}),
+        ('POST', '/missions', mission),
+        ('POST', '/missions/bulk', [mission] * 10),
+        ('GET', '/missions', None),
+        ('GET', '/missions?ids=3,1,2&include=targets', None),
+        # two statements whatever the page size, the targets of all 11 missions come from one query
+        ('GET', '/missions?limit=100&include=targets', None),
+        ('GET', '/missions?cursor=&with_total=true&include=targets', None),
+        ('GET', '/missions/1', None),
+        ('PATCH', '/missions/1/assign', {'cat_id': 1}),
+        ('PATCH', '/missions/1/targets/1', {'notes': 'Spotted near the border'}),
+        ('PATCH', '/missions/1/targets/1', {'completed': True}),
+        ('DELETE', '/missions/2', None),
+        ('DELETE', '/cats/1', None),
+    ]
+
+
+async def run(client: AsyncClient, requests: list[tuple[str, str, object]], failures: list[str]) -> None:
+    for method, url, payload in requests:
+        try:
+            response = await client.request(method, url, json=payload)
+        except QueryBudgetExceededError as err:
+            failures.append(str(err))
+            continue
+        if response.is_error:
+            failures.append(f'{method} {url}: unexpected status {response.status_code}')
+
+
+async def main() -> int:
+    # the middleware is only installed when the app is built with the mode enabled
+    config.query_budget_mode = 'raise'
+    default_budget = config.query_budget_default
+    config.query_budget_default = 0
+    config.query_budgets = BUDGETS
+
+    from benchmarks.harness import STUB_BREEDS, bench_client
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        async with bench_client(Path(tmp_dir) / 'bench.db') as client:
+            await run(client, scenario(STUB_BREEDS[0].name), failures)
+
+            config.query_budget_default = default_budget
+            config.query_budgets = {}
+            config.bulk_insert_chunk_size = 1
+            await run(client, large_imports(STUB_BREEDS[0].name, rows=(default_budget or 0) + 1), failures)
+
+    print(json.dumps({'budgets': BUDGETS, 'failures': failures}, indent=2))  # noqa: T201
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
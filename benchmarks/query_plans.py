@@ -0,0 +1,97 @@
+"""
+Assert that the hot repository lookups are served by indexes, using `EXPLAIN QUERY PLAN`.
+
+Builds a database with the Alembic migrations (so the check covers what production actually gets),
+runs the repository methods, captures the SQL they emit and checks the plan of every statement (for an UPDATE,
+the subqueries of its WHERE clause).
+Exits non-zero if a statement falls back to a table scan.
+
+    uv run python -m benchmarks.query_plans
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.repositories.sql_repos.missions import MissionRepository
+from src.repositories.sql_repos.targets import TargetRepository
+
+
+TARGET_INDEXES = {'ix_targets_mission_id_completed', 'uq_target_mission_name'}
+
+# repository call -> index its statement must use
+CHECKS = {
+    # the NOT EXISTS lookup of the cat's other active missions
+    'MissionRepository.assign_cat': (
+        lambda session: MissionRepository(session).assign_cat(mission_id=1, cat_id=1),
+        {'uq_missions_active_cat_id', 'ix_missions_cat_id_completed'},
+    ),
+    # the NOT EXISTS lookup of the mission's open targets
+    'MissionRepository.sync_completion': (
+        lambda session: MissionRepository(session).sync_completion(mission_id=1),
+        TARGET_INDEXES,
+    ),
+    'TargetRepository.get_by_mission_id': (
+        lambda session: TargetRepository(session).get_by_mission_id(mission_id=1),
+        TARGET_INDEXES,
+    ),
+    'TargetRepository.get_by_mission_ids': (
+        lambda session: TargetRepository(session).get_by_mission_ids(mission_ids=[1, 2, 3]),
+        TARGET_INDEXES,
+    ),
+}
+
+
+def migrate(db_url: str) -> None:
+    subprocess.run(
+        [sys.executable, '-m', 'alembic', 'upgrade', 'head'],
+        check=True,
+        capture_output=True,
+        env={**os.environ, 'DB_URL': db_url},
+    )
+
+
+async def main() -> int:
+    failures = 0
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_url = f'sqlite+aiosqlite:///{Path(tmp_dir) / "plans.db"}'
+        migrate(db_url)
+        engine = create_async_engine(db_url)
+
+        statements = []
+
+        @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+        def capture(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+            if statement.lstrip().upper().startswith(('SELECT', 'UPDATE')):
+                statements.append((statement, parameters))
+
+        for name, (call, expected_indexes) in CHECKS.items():
+            # a session per call, assign_cat must run the first statement of its session
+            async with AsyncSession(engine) as session:
+                statements.clear()
+                await call(session)
+                for statement, parameters in list(statements):
+                    connection = await session.connection()
+                    rows = await connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', tuple(parameters))
+                    plan = [row.detail for row in rows]
+                    used = any(index in detail for detail in plan for index in expected_indexes)
+                    scans = [detail for detail in plan if detail.startswith('SCAN')]
+                    ok = used and not scans
+                    failures += not ok
+                    report[name] = {'ok': ok, 'plan': plan}
+        await engine.dispose()
+
+    print(json.dumps(report, indent=2))  # noqa: T201
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
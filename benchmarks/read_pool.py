@@ -0,0 +1,91 @@
+"""
+Mixed read/write load with read-only endpoints on their own connection pool vs sharing the writers' pool.
+
+Writers create cats through `POST /cats` while readers hit `GET /cats/{id}` and `GET /cats`, all concurrently and
+in-process, for a fixed duration.
+
+    uv run python -m benchmarks.read_pool --readers 64 --writers 8 --seconds 5
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import AsyncClient
+
+from benchmarks.harness import STUB_BREEDS, bench_client
+
+
+SEED_CATS = 1000
+
+
+async def writer(client: AsyncClient, deadline: float, latencies: list[float]) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.post(
+            '/cats',
+            json={'name': 'Writer cat', 'breed': STUB_BREEDS[0].name, 'salary': 1000, 'years_of_experience': 3},
+        )
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+
+
+async def reader(client: AsyncClient, deadline: float, latencies: list[float]) -> None:
+    while time.perf_counter() < deadline:
+        url = f'/cats/{random.randint(1, SEED_CATS)}' if random.random() < 0.8 else '/cats?limit=20'
+        started = time.perf_counter()
+        response = await client.get(url)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+
+
+def summarize(latencies: list[float], seconds: float) -> dict:
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        'requests_per_second': round(len(latencies) / seconds),
+        'p50_ms': round(quantiles[49] * 1000, 2),
+        'p95_ms': round(quantiles[94] * 1000, 2),
+    }
+
+
+async def run(readers: int, writers: int, seconds: float, *, read_pool: bool) -> dict:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        async with bench_client(Path(tmp_dir) / 'bench.db', read_pool=read_pool) as client:
+            seed = [
+                {'name': f'Cat {i}', 'breed': STUB_BREEDS[0].name, 'salary': 1000, 'years_of_experience': 1}
+                for i in range(SEED_CATS)
+            ]
+            (await client.post('/cats/bulk', json=seed)).raise_for_status()
+
+            read_latencies: list[float] = []
+            write_latencies: list[float] = []
+            deadline = time.perf_counter() + seconds
+            await asyncio.gather(
+                *(reader(client, deadline, read_latencies) for _ in range(readers)),
+                *(writer(client, deadline, write_latencies) for _ in range(writers)),
+            )
+    return {'reads': summarize(read_latencies, seconds), 'writes': summarize(write_latencies, seconds)}
+
+
+async def main(readers: int, writers: int, seconds: float) -> None:
+    report = {
+        'readers': readers,
+        'writers': writers,
+        'shared_pool': await run(readers, writers, seconds, read_pool=False),
+        'separate_read_pool': await run(readers, writers, seconds, read_pool=True),
+    }
+    print(json.dumps(report, indent=2))  # noqa: T201
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--readers', type=int, default=64)
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.readers, args.writers, args.seconds))
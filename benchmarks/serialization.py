@@ -0,0 +1,106 @@
+"""
+Serialization cost of one page of results: the old path vs the `from_attributes` + orjson fast path.
+
+Before: the service copied every ORM row into a schema by hand, then FastAPI validated the page again against the
+route's `response_model`, dumped it to a dict and encoded it with the standard library `json`. After: the service
+validates the ORM rows once (`from_attributes`, one validator call per page) and the route returns a `ModelResponse`,
+which pydantic-core dumps and orjson encodes without a second validation. No database is involved, the rows are
+built in memory; reading their mapped attributes is a fixed cost shared by both paths.
+
+    uv run python -m benchmarks.serialization --rows 100 --number 2000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from src.main import app
+from src.models import Mission, SpyCat
+from src.schemas.base import PaginatedResponseSchema
+from src.schemas.cats import SpyCatListResponseSchema
+from src.schemas.missions import MissionResponseSchema
+from src.services.cats import cat_list_adapter
+from src.services.missions import mission_list_adapter
+from src.utils.responses import ModelResponse
+
+
+NEXT_URL = 'http://localhost/cats?limit=100&cursor=eyJpZCI6MTAwfQ'
+
+
+def get_route(path: str) -> APIRoute:
+    return next(
+        route for route in app.routes if isinstance(route, APIRoute) and route.path == path and 'GET' in route.methods
+    )
+
+
+async def render_before(route: APIRoute, page: PaginatedResponseSchema) -> bytes:
+    content = await serialize_response(field=route.response_field, response_content=page)
+    return JSONResponse(content).body
+
+
+async def cats_before(cats: list[SpyCat]) -> bytes:
+    results = [SpyCatListResponseSchema(id=cat.id, name=cat.name, breed=cat.breed, salary=cat.salary) for cat in cats]
+    page = PaginatedResponseSchema[SpyCatListResponseSchema](results=results, next_url=NEXT_URL)
+    return await render_before(get_route('/cats'), page)
+
+
+async def cats_after(cats: list[SpyCat]) -> bytes:
+    results = cat_list_adapter.validate_python(cats)
+    return ModelResponse(PaginatedResponseSchema[SpyCatListResponseSchema](results=results, next_url=NEXT_URL)).body
+
+
+async def missions_before(missions: list[Mission]) -> bytes:
+    results = [
+        MissionResponseSchema(id=mission.id, completed=mission.completed, cat_id=mission.cat_id) for mission in missions
+    ]
+    page = PaginatedResponseSchema[MissionResponseSchema](results=results, next_url=NEXT_URL)
+    return await render_before(get_route('/missions'), page)
+
+
+async def missions_after(missions: list[Mission]) -> bytes:
+    results = mission_list_adapter.validate_python(missions)
+    return ModelResponse(PaginatedResponseSchema[MissionResponseSchema](results=results, next_url=NEXT_URL)).body
+
+
+async def measure[T](render: Callable[[T], Awaitable[bytes]], rows: T, number: int) -> float:
+    """Microseconds per page."""
+    started = time.perf_counter()
+    for _ in range(number):
+        await render(rows)
+    return (time.perf_counter() - started) / number * 1e6
+
+
+async def main(row_count: int, number: int) -> None:
+    cats = [
+        SpyCat(id=i, name=f'Cat {i}', breed='Abyssinian', salary=1000.0 + i, years_of_experience=i % 20)
+        for i in range(1, row_count + 1)
+    ]
+    missions = [Mission(id=i, completed=i % 3 == 0, cat_id=i if i % 2 else None) for i in range(1, row_count + 1)]
+
+    report = {'rows_per_page': row_count, 'pages': number}
+    cases = (('cats', cats, cats_before, cats_after), ('missions', missions, missions_before, missions_after))
+    for name, rows, before, after in cases:
+        assert json.loads(await before(rows)) == json.loads(await after(rows))
+        for render in (before, after):
+            await measure(render, rows, number // 10)  # warm-up
+        before_us = await measure(before, rows, number)
+        after_us = await measure(after, rows, number)
+        report[name] = {
+            'before_us_per_page': round(before_us, 1),
+            'after_us_per_page': round(after_us, 1),
+            'speedup': round(before_us / after_us, 2),
+        }
+    print(json.dumps(report, indent=2))  # noqa: T201
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100, help='rows per page')
+    parser.add_argument('--number', type=int, default=2000, help='pages to serialize per path')
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.number))
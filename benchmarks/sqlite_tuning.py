@@ -0,0 +1,86 @@
+"""
+Concurrent write throughput of SQLite with driver defaults vs the tuning profile applied by `create_db_engine`.
+
+Every writer commits one small transaction per insert, which is what the API does per request; readers keep
+listing cats at the same time.
+
+    uv run python -m benchmarks.sqlite_tuning --writers 16 --transactions 200
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.dependencies.db import create_db_engine
+from src.models.cats import Base, SpyCat
+
+
+async def writer(engine: AsyncEngine, transactions: int, errors: list[str]) -> None:
+    for i in range(transactions):
+        try:
+            async with engine.begin() as connection:
+                await connection.execute(
+                    insert(SpyCat).values(name=f'Cat {i}', breed='Bengal', salary=1000, years_of_experience=1)
+                )
+        except OperationalError as err:
+            errors.append(str(err.orig))
+
+
+async def reader(engine: AsyncEngine, stop: asyncio.Event) -> int:
+    reads = 0
+    while not stop.is_set():
+        async with engine.connect() as connection:
+            await connection.execute(select(SpyCat.id).order_by(SpyCat.id.desc()).limit(20))
+        reads += 1
+    return reads
+
+
+async def run_profile(engine: AsyncEngine, writers: int, readers: int, transactions: int) -> dict:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    errors: list[str] = []
+    stop = asyncio.Event()
+    reader_tasks = [asyncio.create_task(reader(engine, stop)) for _ in range(readers)]
+    started = time.perf_counter()
+    await asyncio.gather(*(writer(engine, transactions, errors) for _ in range(writers)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    reads = sum(await asyncio.gather(*reader_tasks))
+    await engine.dispose()
+    return {
+        'commits_per_second': round((writers * transactions - len(errors)) / elapsed),
+        'reads_per_second': round(reads / elapsed),
+        'errors': len(errors),
+    }
+
+
+async def main(writers: int, readers: int, transactions: int) -> None:
+    pool_options = {'pool_size': writers + readers, 'max_overflow': 0}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        default_engine = create_async_engine(f'sqlite+aiosqlite:///{Path(tmp_dir) / "default.db"}', **pool_options)
+        tuned_engine = create_db_engine(f'sqlite+aiosqlite:///{Path(tmp_dir) / "tuned.db"}', **pool_options)
+        report = {
+            'writers': writers,
+            'readers': readers,
+            'transactions_per_writer': transactions,
+            'driver_defaults': await run_profile(default_engine, writers, readers, transactions),
+            'tuned': await run_profile(tuned_engine, writers, readers, transactions),
+        }
+    print(json.dumps(report, indent=2))  # noqa: T201
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--writers', type=int, default=16)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--transactions', type=int, default=200, help='committed inserts per writer')
+    args = parser.parse_args()
+    asyncio.run(main(args.writers, args.readers, args.transactions))
@@ -0,0 +1,115 @@
+"""
+Concurrency check of `PATCH /missions/{mission_id}/targets/{target_id}`: the final state must always be consistent.
+
+Every round creates `--missions` missions with three targets each, then fires one completion and `--notes` note
+updates per target, shuffled, from `--concurrency` concurrent clients. Afterwards every target and every mission
+must be completed, no request may fail with a server error, and each mission's version must have been bumped
+exactly once per accepted update of one of its targets (no lost updates). Exits 1 on any violation:
+
+    uv run python -m benchmarks.target_completion --missions 200 --concurrency 64 --rounds 3
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from httpx import AsyncClient
+
+from benchmarks.harness import bench_client
+
+
+TARGETS_PER_MISSION = 3
+
+
+async def create_missions(client: AsyncClient, count: int) -> list[int]:
+    missions = [
+        {'targets': [{'name': f'Target {n}', 'country': 'UA'} for n in range(TARGETS_PER_MISSION)]}
+        for _ in range(count)
+    ]
+    response = await client.post('/missions/bulk', json=missions)
+    response.raise_for_status()
+    return response.json()['created_ids']
+
+
+async def run_round(client: AsyncClient, db_path: Path, args: argparse.Namespace) -> dict:
+    mission_ids = set(await create_missions(client, args.missions))
+    with sqlite3.connect(db_path) as connection:
+        placeholders = ','.join('?' * len(mission_ids))
+        targets = connection.execute(
+            f'SELECT mission_id, id FROM targets WHERE mission_id IN ({placeholders})',
+            tuple(mission_ids),
+        ).fetchall()
+
+    requests = [(mission_id, target_id, {'completed': True}) for mission_id, target_id in targets]
+    requests += [
+        (mission_id, target_id, {'notes': f'Report {n}'})
+        for mission_id, target_id in targets
+        for n in range(args.notes)
+    ]
+    random.shuffle(requests)
+
+    pending = iter(requests)
+    statuses: Counter[int] = Counter()
+    accepted: Counter[int] = Counter()
+
+    async def worker() -> None:
+        for mission_id, target_id, payload in pending:
+            response = await client.patch(f'/missions/{mission_id}/targets/{target_id}', json=payload)
+            statuses[response.status_code] += 1
+            if response.status_code == 200:
+                accepted[mission_id] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    violations = [f'HTTP {status}: {count} requests' for status, count in statuses.items() if status >= 500]
+    with sqlite3.connect(db_path) as connection:
+        rows = connection.execute(
+            'SELECT missions.id, missions.completed, missions.version, '
+            'SUM(targets.completed), COUNT(targets.id) FROM missions JOIN targets ON targets.mission_id = missions.id '
+            f'WHERE missions.id IN ({placeholders}) GROUP BY missions.id',
+            tuple(mission_ids),
+        ).fetchall()
+    for mission_id, completed, version, completed_targets, target_count in rows:
+        if completed_targets != target_count:
+            violations.append(f'mission {mission_id}: {completed_targets}/{target_count} targets completed')
+        if not completed:
+            violations.append(f'mission {mission_id}: every target completed but the mission is open')
+        if version != 1 + accepted[mission_id]:
+            violations.append(f'mission {mission_id}: version {version} after {accepted[mission_id]} updates')
+
+    return {
+        'requests': len(requests),
+        'statuses': {str(status): count for status, count in sorted(statuses.items())},
+        'requests_per_second': round(len(requests) / elapsed),
+        'violations': violations,
+    }
+
+
+async def main(args: argparse.Namespace) -> int:
+    random.seed(args.seed)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir) / 'bench.db'
+        async with bench_client(db_path) as client:
+            rounds = [await run_round(client, db_path, args) for _ in range(args.rounds)]
+
+    print(json.dumps({'rounds': rounds}, indent=2))  # noqa: T201
+    return 1 if any(round_['violations'] for round_ in rounds) else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--missions', type=int, default=200, help='missions per round, three targets each')
+    parser.add_argument('--notes', type=int, default=2, help='note updates per target besides its completion')
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,39 @@
+"""Mission and target indexes, one active mission per cat
+
+Revision ID: 3b9d2f6c1a47
+Revises: e887fa51ea1f
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d2f6c1a47'
+down_revision: Union[str, Sequence[str], None] = 'e887fa51ea1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_missions_cat_id_completed', 'missions', ['cat_id', 'completed'], unique=False)
+    op.create_index(
+        'uq_missions_active_cat_id',
+        'missions',
+        ['cat_id'],
+        unique=True,
+        sqlite_where=sa.text('completed = 0'),
+    )
+    op.create_index('ix_targets_mission_id_completed', 'targets', ['mission_id', 'completed'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_targets_mission_id_completed', table_name='targets')
+    op.drop_index('uq_missions_active_cat_id', table_name='missions')
+    op.drop_index('ix_missions_cat_id_completed', table_name='missions')
@@ -0,0 +1,38 @@
+"""Delete a cat's missions with the cat at the database level
+
+Revision ID: 5e8a3c1f9b70
+Revises: 7c41e0b95d2a
+Create Date: 2026-10-18 16:21:05.204417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8a3c1f9b70'
+down_revision: Union[str, Sequence[str], None] = '7c41e0b95d2a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# the initial migration left the foreign key unnamed, batch mode names the reflected one with this convention
+NAMING_CONVENTION = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+FK_NAME = 'fk_missions_cat_id_spy_cats'
+
+
+def _replace_cat_fk(ondelete: str) -> None:
+    with op.batch_alter_table('missions', naming_convention=NAMING_CONVENTION) as batch_op:
+        batch_op.drop_constraint(FK_NAME, type_='foreignkey')
+        batch_op.create_foreign_key(FK_NAME, 'spy_cats', ['cat_id'], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_cat_fk('CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_cat_fk('SET NULL')
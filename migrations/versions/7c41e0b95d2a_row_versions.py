@@ -0,0 +1,34 @@
+"""Row version counters for ETags
+
+Revision ID: 7c41e0b95d2a
+Revises: 3b9d2f6c1a47
+Create Date: 2026-10-18 14:03:27.519862
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c41e0b95d2a'
+down_revision: Union[str, Sequence[str], None] = '3b9d2f6c1a47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('spy_cats', 'missions', 'targets')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.add_column(table, sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('version')
@@ -0,0 +1,38 @@
+"""Never reuse cat and mission ids
+
+Revision ID: 9d4f2b7e6a13
+Revises: 5e8a3c1f9b70
+Create Date: 2026-10-19 10:42:17.583920
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f2b7e6a13'
+down_revision: Union[str, Sequence[str], None] = '5e8a3c1f9b70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# ETags are built from the row version, which starts at 1 again for a new row that would reuse a deleted id
+TABLES = ('spy_cats', 'missions')
+
+
+def _recreate(*, autoincrement: bool) -> None:
+    for table in TABLES:
+        # no operations: recreating the table with the new kwargs is the whole change
+        with op.batch_alter_table(table, recreate='always', table_kwargs={'sqlite_autoincrement': autoincrement}):
+            pass
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _recreate(autoincrement=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recreate(autoincrement=False)
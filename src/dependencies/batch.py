@@ -0,0 +1,36 @@
+from http import HTTPStatus
+
+from fastapi import HTTPException, Query
+
+
+MAX_BATCH_IDS = 100
+
+
+def ids_dependency(
+    ids: str | None = Query(
+        default=None,
+        description=(
+            f'Comma-separated ids (at most {MAX_BATCH_IDS}) to fetch in one request, instead of a page; results '
+            'follow their order and unknown ids are left out'
+        ),
+        examples=['3,1,2'],
+    ),
+) -> list[int] | None:
+    if ids is None:
+        return None
+
+    try:
+        parsed = [int(part) for part in ids.split(',')]
+    except ValueError as err:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Invalid ids',
+        ) from err
+    # repeated ids are returned once, where they first appear
+    unique_ids = list(dict.fromkeys(parsed))
+    if len(unique_ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=f'At most {MAX_BATCH_IDS} ids per request',
+        )
+    return unique_ids
@@ -0,0 +1,7 @@
+from fastapi import Request
+
+from src.services.breeds import BreedCatalogService
+
+
+def get_breed_catalog(request: Request) -> BreedCatalogService:
+    return request.app.state.breed_catalog
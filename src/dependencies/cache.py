@@ -0,0 +1,7 @@
+from fastapi import Request
+
+from src.services.entity_cache import EntityCache
+
+
+def get_entity_cache(request: Request) -> EntityCache:
+    return request.app.state.entity_cache
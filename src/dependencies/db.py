@@ -1,14 +1,66 @@
+import time
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.settings import config
+from src.utils.metrics import db_pool_checkout_wait_seconds
+from src.utils.queries import instrument_engine
+from src.utils.sqlite import apply_sqlite_pragmas, apply_sqlite_read_only_pragmas, to_read_only_url
 
 
-engine = create_async_engine(config.db_url, echo=True)
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout took, waiting for a free connection included."""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            db_pool_checkout_wait_seconds.observe(self.logging_name, value=time.perf_counter() - started)
+
+
+def create_db_engine(db_url: str, *, name: str = 'default', read_only: bool = False, **kwargs) -> AsyncEngine:
+    url = make_url(db_url)
+    if url.get_dialect().get_pool_class(url) is AsyncAdaptedQueuePool:
+        kwargs.setdefault('poolclass', TimedAsyncAdaptedQueuePool)
+    db_engine = create_async_engine(url, pool_logging_name=name, **kwargs)
+    instrument_engine(db_engine)
+    if db_engine.dialect.name == 'sqlite':
+        listener = apply_sqlite_read_only_pragmas if read_only else apply_sqlite_pragmas
+        event.listen(db_engine.sync_engine, 'connect', listener)
+    return db_engine
+
+
+engine = create_db_engine(
+    config.db_url,
+    name='primary',
+    echo=config.db_echo,
+    pool_size=config.db_pool_size,
+    max_overflow=config.db_max_overflow,
+)
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# separate pool for read-only endpoints, so reads never wait for a connection held by a writer
+read_engine = create_db_engine(
+    config.db_read_url or to_read_only_url(config.db_url),
+    name='read_only',
+    read_only=True,
+    echo=config.db_echo,
+    pool_size=config.db_read_pool_size,
+    max_overflow=config.db_max_overflow,
+)
+async_read_session_maker = async_sessionmaker(read_engine, class_=AsyncSession, expire_on_commit=False)
+
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         yield session
+
+
+async def get_db_read_session() -> AsyncGenerator[AsyncSession, None]:
+    async with async_read_session_maker() as session:
+        yield session
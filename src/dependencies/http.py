@@ -1,6 +1,31 @@
-from httpx import AsyncClient
+from fastapi import Request
+from httpx import AsyncClient, Limits, Timeout
 
+from src.settings import config
 
-async def get_http_client() -> AsyncClient:
-    async with AsyncClient() as client:
-        yield client
+
+def create_http_client() -> AsyncClient:
+    """
+    Build the app-lifetime HTTP client.
+
+    Created once in the application lifespan so that connections (and TLS sessions)
+    are pooled and reused across requests instead of being set up per request.
+    """
+    return AsyncClient(
+        http2=config.http2,
+        limits=Limits(
+            max_connections=config.http_max_connections,
+            max_keepalive_connections=config.http_max_keepalive_connections,
+            keepalive_expiry=config.http_keepalive_expiry,
+        ),
+        timeout=Timeout(
+            connect=config.http_connect_timeout,
+            read=config.http_read_timeout,
+            write=config.http_write_timeout,
+            pool=config.http_pool_timeout,
+        ),
+    )
+
+
+def get_http_client(request: Request) -> AsyncClient:
+    return request.app.state.http_client
@@ -1,13 +1,37 @@
-from fastapi import Query
+from http import HTTPStatus
 
-from src.structures import LimitOffsetImplPaginationParams
+from fastapi import HTTPException, Query
 
+from src.structures import CursorPaginationParams, LimitOffsetImplPaginationParams, PaginationParams
+from src.utils.pagination import decode_cursor
 
-def limit_offset_pagination_dependency(
+
+def pagination_dependency(
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-) -> LimitOffsetImplPaginationParams:
-    return LimitOffsetImplPaginationParams(
+    cursor: str | None = Query(
+        default=None,
+        description='Opaque cursor from a previous `next_url`; pass an empty value to start keyset pagination',
+    ),
+    *,
+    with_total: bool = Query(default=False, description='Return the exact total in the `X-Total-Count` header'),
+) -> PaginationParams:
+    if cursor is None:
+        return LimitOffsetImplPaginationParams(
+            limit=limit,
+            offset=offset,
+            with_total=with_total,
+        )
+
+    try:
+        after_id = decode_cursor(cursor)
+    except ValueError as err:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Invalid cursor',
+        ) from err
+    return CursorPaginationParams(
         limit=limit,
-        offset=offset,
+        after_id=after_id,
+        with_total=with_total,
     )
@@ -0,0 +1,39 @@
+"""Services wired to the read-only database session, for endpoints that never write."""
+
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dependencies.breeds import get_breed_catalog
+from src.dependencies.cache import get_entity_cache
+from src.dependencies.db import get_db_read_session
+from src.repositories.sql_repos.cats import CatSpyRepository
+from src.repositories.sql_repos.missions import MissionRepository
+from src.repositories.sql_repos.targets import TargetRepository
+from src.services.breeds import BreedCatalogService
+from src.services.cats import CatSpyService
+from src.services.entity_cache import EntityCache
+from src.services.missions import MissionService
+
+
+def get_cat_spy_read_service(
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    breed_catalog: Annotated[BreedCatalogService, Depends(get_breed_catalog)],
+    entity_cache: Annotated[EntityCache, Depends(get_entity_cache)],
+) -> CatSpyService:
+    return CatSpyService(
+        cat_spy_repository=CatSpyRepository(session), breed_catalog=breed_catalog, entity_cache=entity_cache
+    )
+
+
+def get_mission_read_service(
+    session: Annotated[AsyncSession, Depends(get_db_read_session)],
+    entity_cache: Annotated[EntityCache, Depends(get_entity_cache)],
+) -> MissionService:
+    return MissionService(
+        cat_repository=CatSpyRepository(session),
+        mission_repository=MissionRepository(session),
+        target_repository=TargetRepository(session),
+        entity_cache=entity_cache,
+    )
@@ -1 +1,4 @@
 class NotFoundError(Exception): ...
+
+
+class InvalidPayloadError(Exception): ...
@@ -0,0 +1 @@
+class QueryBudgetExceededError(Exception): ...
@@ -1,20 +1,69 @@
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from src.dependencies.db import engine, read_engine
+from src.dependencies.http import create_http_client
+from src.middlewares.metrics import MetricsMiddleware
+from src.middlewares.query_budget import QueryBudgetMiddleware
+from src.repositories.rest_api.breads_api import TheCatApiRepository
 from src.routers.cats import router as cats_router
+from src.routers.metrics import router as metrics_router
 from src.routers.missions import router as missions_router
 from src.routers.targets import router as targets_router
+from src.services.breeds import BreedCatalogService
+from src.services.entity_cache import InMemoryEntityCache
+from src.settings import config
+from src.utils.sqlite import run_sqlite_maintenance
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    async with create_http_client() as http_client:
+        application.state.http_client = http_client
+        breed_catalog = BreedCatalogService(
+            fetch_snapshot=TheCatApiRepository(http_client).get_breeds_snapshot,
+            ttl=config.breed_catalog_ttl,
+            refresh_ahead=config.breed_catalog_refresh_ahead,
+            retry_interval=config.breed_catalog_retry_interval,
+            snapshot_path=config.breed_catalog_snapshot_path,
+        )
+        await breed_catalog.start()
+        application.state.breed_catalog = breed_catalog
+        db_maintenance = (
+            asyncio.create_task(run_sqlite_maintenance(engine)) if engine.dialect.name == 'sqlite' else None
+        )
+        try:
+            yield
+        finally:
+            await breed_catalog.stop()
+            if db_maintenance is not None:
+                db_maintenance.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await db_maintenance
+            await engine.dispose()
+            await read_engine.dispose()
 
 
 def register_routers(application: FastAPI):
     application.include_router(cats_router)
     application.include_router(missions_router)
     application.include_router(targets_router)
+    application.include_router(metrics_router)
 
     return application
 
 
 def get_app():
-    application = FastAPI()
+    application = FastAPI(lifespan=lifespan)
+    application.state.entity_cache = InMemoryEntityCache(
+        max_entries=config.entity_cache_max_entries, ttl=config.entity_cache_ttl
+    )
+    if config.query_budget_mode != 'off':
+        application.add_middleware(QueryBudgetMiddleware)
+    application.add_middleware(MetricsMiddleware)
     register_routers(application)
     return application
 
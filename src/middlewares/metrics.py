@@ -0,0 +1,58 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.metrics import (
+    http_request_db_duration_seconds,
+    http_request_db_queries,
+    http_request_duration_seconds,
+    http_requests_in_progress,
+)
+from src.utils.queries import QueryStats, current_query_stats
+
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+
+class MetricsMiddleware:
+    """
+    Record latency, status and SQL statements of every HTTP request.
+
+    Requests are labelled by route template (`/cats/{cat_id}`), never by the raw path, to keep the number of
+    series bounded. Written as a plain ASGI middleware to avoid the overhead of `BaseHTTPMiddleware`.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        query_stats = QueryStats()
+        token = current_query_stats.set(query_stats)
+        http_requests_in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started
+            http_requests_in_progress.dec()
+            current_query_stats.reset(token)
+
+            # the router stores the matched route in the (shared) scope
+            route = scope.get('route')
+            route_path = getattr(route, 'path', UNMATCHED_ROUTE)
+            method = scope['method']
+            http_request_duration_seconds.observe(method, route_path, status, value=duration)
+            http_request_db_queries.observe(method, route_path, value=query_stats.count)
+            http_request_db_duration_seconds.observe(method, route_path, value=query_stats.duration)
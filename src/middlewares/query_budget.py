@@ -0,0 +1,76 @@
+import json
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.errors.queries import QueryBudgetExceededError
+from src.settings import config
+from src.utils.queries import QueryStats, current_query_stats
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetMiddleware:
+    """
+    Check every request against its route's SQL statement budget and for repeated statement shapes (N+1).
+
+    The check runs when the response starts, so in `raise` mode an offending request fails with a server error
+    instead of answering. Only installed when `config.query_budget_mode` is not `off`.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        # share the stats of the metrics middleware when it is installed
+        query_stats = current_query_stats.get()
+        token = None
+        if query_stats is None:
+            query_stats = QueryStats()
+            token = current_query_stats.set(query_stats)
+
+        async def send_checked(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                check_query_budget(scope, query_stats)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_checked)
+        finally:
+            if token is not None:
+                current_query_stats.reset(token)
+
+
+def check_query_budget(scope: Scope, query_stats: QueryStats) -> None:
+    route = scope.get('route')
+    if route is None:
+        return
+
+    route_key = f'{scope["method"]} {route.path}'
+    exempt = route_key in config.query_budget_exempt_routes
+    problems = []
+    # an explicit per-route budget applies to exempt routes too
+    budget = config.query_budgets.get(route_key, None if exempt else config.query_budget_default)
+    if budget is not None and query_stats.count > budget:
+        problems.append(f'{query_stats.count} SQL statements, budget is {budget}')
+    if not exempt:
+        problems.extend(
+            f'{count} x {fingerprint}'
+            for fingerprint, count in query_stats.fingerprints.items()
+            if count >= config.query_repeat_threshold
+        )
+    if not problems:
+        return
+
+    if config.query_budget_mode == 'raise':
+        raise QueryBudgetExceededError(f'{route_key}: {"; ".join(problems)}')
+    logger.warning(
+        json.dumps(
+            {'event': 'query_budget_exceeded', 'route': route_key, 'count': query_stats.count, 'problems': problems}
+        )
+    )
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Float, Integer, String
+from sqlalchemy import Float, Integer, String, literal_column, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -14,12 +14,21 @@ class Base(DeclarativeBase):
 
 class SpyCat(Base):
     __tablename__ = 'spy_cats'
+    # ids are never reused, a new row with a deleted cat's id would match its ETag (both start at version 1)
+    __table_args__ = {'sqlite_autoincrement': True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     years_of_experience: Mapped[int] = mapped_column(Integer, nullable=False)
     breed: Mapped[str] = mapped_column(String(100), nullable=False)
     salary: Mapped[float] = mapped_column(Float, nullable=False)
-
-    # one-to-many: one cat can have multiple missions, but only one active at a time
-    missions: Mapped[list['Mission']] = relationship(back_populates='cat', cascade='all, delete-orphan')
+    # bumped by every UPDATE, feeds the ETag of API responses
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default=text('1'), onupdate=literal_column('version') + 1
+    )
+
+    # one-to-many: one cat can have multiple missions, but only one active at a time;
+    # they are deleted with the cat by the ON DELETE CASCADE of their foreign key, without being loaded
+    missions: Mapped[list['Mission']] = relationship(
+        back_populates='cat', cascade='all, delete-orphan', passive_deletes=True
+    )
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, ForeignKey, Integer
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, literal_column, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.cats import Base, SpyCat
@@ -14,17 +14,31 @@ if TYPE_CHECKING:
 
 class Mission(Base):
     __tablename__ = 'missions'
+    __table_args__ = (
+        Index('ix_missions_cat_id_completed', 'cat_id', 'completed'),
+        # a cat can have only one active mission at a time
+        Index('uq_missions_active_cat_id', 'cat_id', unique=True, sqlite_where=text('completed = 0')),
+        # ids are never reused, see SpyCat
+        {'sqlite_autoincrement': True},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     completed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # also bumped when one of its targets changes, mission details embed them
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default=text('1'), onupdate=literal_column('version') + 1
+    )
 
     # FK to SpyCat (nullable until assigned)
     cat_id: Mapped[Optional[int]] = mapped_column(
         Integer,
-        ForeignKey('spy_cats.id', ondelete='SET NULL'),
+        ForeignKey('spy_cats.id', name='fk_missions_cat_id_spy_cats', ondelete='CASCADE'),
         nullable=True,
     )
 
     # relationships
     cat: Mapped[Optional['SpyCat']] = relationship(back_populates='missions')
-    targets: Mapped[list['Target']] = relationship(back_populates='mission', cascade='all, delete-orphan')
+    # targets are deleted by the ON DELETE CASCADE of their foreign key, they are never loaded for that
+    targets: Mapped[list['Target']] = relationship(
+        back_populates='mission', cascade='all, delete-orphan', passive_deletes=True
+    )
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, UniqueConstraint, literal_column, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.cats import Base
@@ -12,13 +12,19 @@ if TYPE_CHECKING:
 
 class Target(Base):
     __tablename__ = 'targets'
-    __table_args__ = (UniqueConstraint('mission_id', 'name', name='uq_target_mission_name'),)
+    __table_args__ = (
+        UniqueConstraint('mission_id', 'name', name='uq_target_mission_name'),
+        Index('ix_targets_mission_id_completed', 'mission_id', 'completed'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     country: Mapped[str] = mapped_column(String(100), nullable=False)
     notes: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     completed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default=text('1'), onupdate=literal_column('version') + 1
+    )
 
     mission_id: Mapped[int] = mapped_column(Integer, ForeignKey('missions.id', ondelete='CASCADE'), nullable=False)
 
@@ -1,24 +1,44 @@
+import hashlib
+from datetime import UTC, datetime
+from http import HTTPStatus
+from typing import Annotated
 from urllib.parse import urljoin
 
-from async_lru import alru_cache
 from fastapi import Depends
 from httpx import AsyncClient
 
 from src.dependencies.http import get_http_client
-from src.repositories.rest_api.structures import CatBreed
+from src.repositories.rest_api.structures import BreedCatalogSnapshot, CatBreed
+from src.settings import config
 
 
 class TheCatApiRepository:
-    def __init__(self, client: AsyncClient = Depends(get_http_client)):
+    def __init__(self, client: Annotated[AsyncClient, Depends(get_http_client)]):
         self._client = client
-        self._base_url = 'https://api.thecatapi.com'
+        self._base_url = config.the_cat_api_url
 
     def _build_url(self, path: str) -> str:
         return urljoin(self._base_url, path)
 
-    @alru_cache(maxsize=1, ttl=3600)  # cache for 1 hour
     async def get_all_breds(self) -> list[CatBreed]:
-        response = await self._client.get(url=self._build_url('v1/breeds'))
+        snapshot = await self.get_breeds_snapshot()
+        return snapshot.breeds
+
+    async def get_breeds_snapshot(self, etag: str | None = None) -> BreedCatalogSnapshot | None:
+        """
+        Fetch all breeds.
+
+        With `etag` the request is conditional: returns None if the upstream list has not changed.
+        """
+        headers = {'If-None-Match': etag} if etag else None
+        response = await self._client.get(url=self._build_url('v1/breeds'), headers=headers)
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return None
         response.raise_for_status()
-        response_json = response.json()
-        return [CatBreed(**breed) for breed in response_json]
+        response_etag = response.headers.get('ETag')
+        return BreedCatalogSnapshot(
+            version=response_etag or hashlib.sha256(response.content).hexdigest()[:16],
+            etag=response_etag,
+            fetched_at=datetime.now(UTC),
+            breeds=[CatBreed(**breed) for breed in response.json()],
+        )
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, HttpUrl, field_validator, Field
+from pydantic import BaseModel, Field, HttpUrl, field_validator
 
 
 class Weight(BaseModel):
@@ -48,7 +49,16 @@ class CatBreed(BaseModel):
     reference_image_id: str | None = None
 
     @field_validator('alt_names', mode='before')
-    def parse_alt_names(cls, alt_names: str) -> list[str]:
+    def parse_alt_names(cls, alt_names: str | list[str]) -> list[str]:
+        if isinstance(alt_names, list):
+            return alt_names
         if alt_names:
             return [name.strip() for name in alt_names.split(',')]
         return []
+
+
+class BreedCatalogSnapshot(BaseModel):
+    version: str  # upstream ETag, or a content hash when the upstream sends none
+    etag: str | None = None
+    fetched_at: datetime
+    breeds: list[CatBreed]
@@ -1,12 +1,12 @@
 from abc import ABCMeta, abstractmethod
-from typing import Annotated, Type
+from typing import Annotated, AsyncIterator, Type
 
 from fastapi import Depends
-from sqlalchemy import func, select
+from sqlalchemy import Column, RowMapping, delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dependencies.db import get_db_session
-from src.structures import LimitOffsetImplPaginationParams
+from src.structures import CursorPaginationParams, PageInfo, PaginationParams
 
 
 class BaseRepository[T](metaclass=ABCMeta):
@@ -19,22 +19,77 @@ class BaseRepository[T](metaclass=ABCMeta):
         self._session = session
 
     async def create(self, entity: T) -> T:
+        # the primary key is populated by the INSERT itself and nothing is expired on commit,
+        # so there is no need to SELECT the entity back
         self._session.add(entity)
         await self._session.commit()
-        await self._session.refresh(entity)
         return entity
 
     async def bulk_create(self, entities: list[T]) -> list[T]:
         self._session.add_all(entities)
         await self._session.commit()
-        for entity in entities:
-            await self._session.refresh(entity)
         return entities
 
-    async def get_paginated(self, pagination_params: LimitOffsetImplPaginationParams, **filters: dict) -> list[T]:
-        stmt = select(self.model).filter_by(**filters).limit(pagination_params.limit).offset(pagination_params.offset)
+    async def insert_many(self, values: list[dict]) -> list[int]:
+        """
+        Insert rows with a single multi-row `INSERT ... RETURNING id`, without committing.
+
+        Returned ids are not guaranteed to follow the order of `values`.
+        """
+        result = await self._session.scalars(insert(self.model).returning(self.model.id), values)
+        return list(result.all())
+
+    async def commit(self) -> None:
+        await self._session.commit()
+
+    async def rollback(self) -> None:
+        await self._session.rollback()
+
+    async def get_paginated(self, pagination_params: PaginationParams, **filters: dict) -> tuple[list[T], PageInfo]:
+        """
+        Fetch one page, by offset or by keyset (seek on the primary key) depending on the params.
+
+        One extra row is fetched to tell whether there is a next page, so no separate COUNT(*) is needed.
+        The exact total is only computed on request, as a scalar subquery of the same statement.
+        """
+        stmt = select(self.model).filter_by(**filters).order_by(self.model.id).limit(pagination_params.limit + 1)
+        if isinstance(pagination_params, CursorPaginationParams):
+            if pagination_params.after_id is not None:
+                stmt = stmt.where(self.model.id > pagination_params.after_id)
+        else:
+            stmt = stmt.offset(pagination_params.offset)
+        if pagination_params.with_total:
+            stmt = stmt.add_columns(select(func.count()).select_from(self.model).filter_by(**filters).scalar_subquery())
+
         result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        rows = result.all()
+        page = rows[: pagination_params.limit]
+        entities = [row[0] for row in page]
+
+        total_count = None
+        if pagination_params.with_total:
+            # an empty page has no row to carry the total
+            total_count = page[0][1] if page else await self.get_count(**filters)
+        return entities, PageInfo(
+            has_next=len(rows) > pagination_params.limit,
+            last_id=entities[-1].id if entities else None,
+            total_count=total_count,
+        )
+
+    async def stream_rows(self, chunk_size: int) -> AsyncIterator[list[RowMapping]]:
+        """
+        Stream the whole table in primary key order, `chunk_size` rows at a time, as plain column mappings.
+
+        Rows come from a server-side cursor and no ORM objects are built, so memory stays flat whatever the table size.
+        """
+        stmt = select(*self._data_columns()).order_by(self.model.id).execution_options(yield_per=chunk_size)
+        result = await self._session.stream(stmt)
+        async for partition in result.mappings().partitions():
+            yield partition
+
+    def _data_columns(self) -> list[Column]:
+        """Table columns without `version`, which only feeds ETags and is not part of the API representation."""
+        return [column for column in self.model.__table__.columns if column.key != 'version']
 
     async def get_count(self, **filters) -> int:
         stmt = select(func.count()).select_from(self.model).filter_by(**filters)
@@ -45,21 +100,28 @@ class BaseRepository[T](metaclass=ABCMeta):
         result = await self._session.execute(select(self.model).where(self.model.id == entity_id))
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, entity_ids: list[int]) -> list[T]:
+        """Entities with the given ids from one `IN (...)` query, in the order of `entity_ids` (unknown ids skipped)."""
+        result = await self._session.scalars(select(self.model).where(self.model.id.in_(entity_ids)))
+        entities_by_id = {entity.id: entity for entity in result}
+        return [entities_by_id[entity_id] for entity_id in entity_ids if entity_id in entities_by_id]
+
+    async def get_version(self, entity_id: int) -> int | None:
+        return await self._session.scalar(select(self.model.version).where(self.model.id == entity_id))
+
     async def update(self, entity: T) -> T:
         await self._session.commit()
         await self._session.refresh(entity)
         return entity
 
-    async def delete(self, entity_id: int) -> bool:
+    async def delete(self, entity_id: int, **filters) -> bool:
         """
-        Delete entity by id.
+        Delete entity by id with a single `DELETE ... RETURNING id`, only if it also matches `filters`.
 
-        Returns True if entity was deleted, False otherwise.
+        Nothing is loaded: dependent rows go with it through the `ON DELETE` actions of their foreign keys, which
+        SQLite only enforces with `sqlite_foreign_keys` on. Returns True if entity was deleted, False otherwise.
         """
-        entity = await self.get_by_id(entity_id)
-        if entity:
-            await self._session.delete(entity)
-            await self._session.commit()
-            return True
-
-        return False
+        stmt = delete(self.model).where(self.model.id == entity_id).filter_by(**filters).returning(self.model.id)
+        deleted_id = await self._session.scalar(stmt)
+        await self._session.commit()
+        return deleted_id is not None
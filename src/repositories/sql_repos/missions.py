@@ -1,13 +1,99 @@
-from sqlalchemy import select, and_
+from sqlalchemy import Row, exists, insert, update
+from sqlalchemy.orm import aliased
 
-from src.models import Mission
+from src.models import Mission, SpyCat, Target
 from src.repositories.sql_repos.base import BaseRepository
+from src.settings import config
+
+
+# SQLite reports a unique index violation by its columns, not its name: this one is uq_missions_active_cat_id
+ACTIVE_CAT_CONFLICT = 'UNIQUE constraint failed: missions.cat_id'
 
 
 class MissionRepository(BaseRepository[Mission]):
     model = Mission
 
-    async def get_active_missions_by_cat_id(self, cat_id: int) -> list[Mission]:
-        stmt = select(self.model).where(and_(self.model.cat_id == cat_id, self.model.completed == False))
+    async def assign_cat(self, mission_id: int, cat_id: int) -> Row | None:
+        """
+        Assign the cat to the mission in one conditional UPDATE ... RETURNING.
+
+        Nothing is updated (and None returned) when the cat does not exist or already has an active mission other
+        than this one, whether this mission is active or completed; re-assigning a cat to its own active mission is
+        a no-op. Checking and writing in one statement leaves no room for a concurrent assignment in between.
+
+        The statement is atomic on its own and runs in autocommit mode, so it must be the first one of the session:
+        SQLite's write lock is then held for the statement only, not until the caller gets to commit (under
+        contention waiting writers starve in SQLite's busy handler and fail with "database is locked").
+        """
+        other_mission = aliased(Mission)
+        stmt = (
+            update(self.model)
+            .where(
+                self.model.id == mission_id,
+                exists().where(SpyCat.id == cat_id),
+                ~exists().where(
+                    other_mission.cat_id == cat_id,
+                    other_mission.completed.is_(False),
+                    other_mission.id != mission_id,
+                ),
+            )
+            .values(cat_id=cat_id)
+            .returning(*self._data_columns(), self.model.version)
+        )
+        await self._session.connection(execution_options={'isolation_level': 'AUTOCOMMIT'})
         result = await self._session.execute(stmt)
-        return result.all()
+        return result.one_or_none()
+
+    async def sync_completion(self, mission_id: int) -> None:
+        """
+        Mark the mission completed once none of its targets is open, without committing.
+
+        One UPDATE whatever the outcome: it also bumps the version, since the mission's targets changed.
+        """
+        all_targets_completed = ~exists().where(Target.mission_id == mission_id, Target.completed.is_(False))
+        await self._session.execute(
+            update(self.model).where(self.model.id == mission_id).values(completed=all_targets_completed)
+        )
+
+    async def insert_with_targets(self, missions: list[Mission]) -> list[Mission]:
+        """
+        Insert new missions together with their targets, without committing and without reloading anything.
+
+        One multi-row INSERT ... RETURNING for the missions and one per chunk of targets, however many missions are
+        passed. SQLite numbers the rows of a multi-row INSERT in the order of its VALUES (AUTOINCREMENT ids only go
+        up), so sorted mission ids follow the missions, whatever order RETURNING lists them in; target ids are
+        matched back through the unique (mission_id, name) pair. The passed (transient) objects get their ids
+        filled in and are returned.
+        """
+        # SQLite has no insert sentinel, sort_by_parameter_order would fall back to one INSERT per row
+        result = await self._session.execute(
+            insert(Mission).returning(Mission.id, Mission.version).execution_options(render_nulls=True),
+            [{'completed': mission.completed, 'cat_id': mission.cat_id} for mission in missions],
+        )
+        targets_by_key = {}
+        for mission, (mission.id, mission.version) in zip(missions, sorted(result), strict=True):
+            for target in mission.targets:
+                target.mission_id = mission.id
+                targets_by_key[mission.id, target.name] = target
+
+        targets = list(targets_by_key.values())
+        for start in range(0, len(targets), config.bulk_insert_chunk_size):
+            rows = await self._session.execute(
+                # render_nulls keeps rows with and without notes in the same statement
+                insert(Target)
+                .returning(Target.id, Target.mission_id, Target.name)
+                .execution_options(render_nulls=True),
+                [
+                    {
+                        'name': target.name,
+                        'country': target.country,
+                        'notes': target.notes,
+                        'completed': target.completed,
+                        'mission_id': target.mission_id,
+                    }
+                    for target in targets[start : start + config.bulk_insert_chunk_size]
+                ],
+            )
+            for target_id, mission_id, name in rows:
+                targets_by_key[mission_id, name].id = target_id
+        return missions
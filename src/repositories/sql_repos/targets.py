@@ -1,6 +1,6 @@
-from sqlalchemy import select
+from sqlalchemy import Row, RowMapping, exists, select, update
 
-from src.models import Target
+from src.models import Mission, Target
 from src.repositories.sql_repos.base import BaseRepository
 
 
@@ -11,3 +11,44 @@ class TargetRepository(BaseRepository[Target]):
         stmt = select(self.model).where(self.model.mission_id == mission_id)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
+
+    async def get_by_mission_ids(self, mission_ids: list[int]) -> list[Target]:
+        """Targets of all the missions in one `IN (...)` query, ordered by mission."""
+        stmt = (
+            select(self.model)
+            .where(self.model.mission_id.in_(mission_ids))
+            .order_by(self.model.mission_id, self.model.id)
+        )
+        result = await self._session.scalars(stmt)
+        return list(result.all())
+
+    async def get_rows_by_mission_id_range(self, first_mission_id: int, last_mission_id: int) -> list[RowMapping]:
+        """Targets of all missions with ids in the (inclusive) range as column mappings, ordered by mission."""
+        stmt = (
+            select(*self._data_columns())
+            .where(self.model.mission_id.between(first_mission_id, last_mission_id))
+            .order_by(self.model.mission_id, self.model.id)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.mappings().all())
+
+    async def update_open(self, mission_id: int, target_id: int, values: dict) -> Row | None:
+        """
+        Update a target that is still open and belongs to an open mission, without committing.
+
+        The checks are part of the UPDATE itself, so nothing can complete the target or the mission in between.
+        Returns the updated row, or None when the target does not qualify (see the service for which reason).
+        """
+        stmt = (
+            update(self.model)
+            .where(
+                self.model.id == target_id,
+                self.model.mission_id == mission_id,
+                self.model.completed.is_(False),
+                exists().where(Mission.id == mission_id, Mission.completed.is_(False)),
+            )
+            .values(values)
+            .returning(*self._data_columns(), self.model.version)
+        )
+        result = await self._session.execute(stmt)
+        return result.one_or_none()
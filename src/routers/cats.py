@@ -1,21 +1,38 @@
 from http import HTTPStatus
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
-from src.dependencies.pagination import limit_offset_pagination_dependency
-from src.errors.base import NotFoundError
+from src.dependencies.batch import ids_dependency
+from src.dependencies.pagination import pagination_dependency
+from src.dependencies.services import get_cat_spy_read_service
+from src.errors.base import InvalidPayloadError, NotFoundError
 from src.errors.cats import InvalidBreedError
 from src.schemas.base import PaginatedResponseSchema
 from src.schemas.cats import (
+    SpyCatBulkCreateResponseSchema,
     SpyCatCreateSchema,
     SpyCatDetailResponseSchema,
     SpyCatListResponseSchema,
     SpyCatUpdateSchema,
 )
 from src.services.cats import CatSpyService
-from src.structures import LimitOffsetImplPaginationParams
-from src.utils.pagination import build_next_url
+from src.settings import config
+from src.structures import PaginationParams
+from src.utils.bulk import iter_bulk_rows
+from src.utils.etags import (
+    ETAG_HEADER,
+    NOT_MODIFIED_RESPONSES,
+    etag_matches,
+    not_modified,
+    page_etag,
+    version_etag,
+)
+from src.utils.ndjson import NDJSON_MEDIA_TYPE, iter_ndjson
+from src.utils.pagination import TOTAL_COUNT_HEADER, build_next_url
+from src.utils.responses import ModelResponse
 
 
 router = APIRouter(prefix='/cats', tags=['Cats'])
@@ -24,7 +41,7 @@ router = APIRouter(prefix='/cats', tags=['Cats'])
 @router.post('', response_model=SpyCatDetailResponseSchema, status_code=HTTPStatus.OK)
 async def create_cat(cat: SpyCatCreateSchema, cat_spy_service: Annotated[CatSpyService, Depends()]):
     try:
-        return await cat_spy_service.create(cat)
+        return ModelResponse(await cat_spy_service.create(cat))
     except InvalidBreedError as err:
         raise HTTPException(
             status_code=HTTPStatus.BAD_REQUEST,
@@ -32,38 +49,105 @@ async def create_cat(cat: SpyCatCreateSchema, cat_spy_service: Annotated[CatSpyS
         ) from err
 
 
-@router.get('', response_model=PaginatedResponseSchema[SpyCatListResponseSchema])
+@router.post(
+    '/bulk',
+    response_model=SpyCatBulkCreateResponseSchema,
+    status_code=HTTPStatus.OK,
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/json': {'schema': TypeAdapter(list[SpyCatCreateSchema]).json_schema()},
+                'application/x-ndjson': {'schema': SpyCatCreateSchema.model_json_schema()},
+            },
+        },
+    },
+)
+async def bulk_create_cats(request: Request, cat_spy_service: Annotated[CatSpyService, Depends()]):
+    """
+    Create many cats at once from a JSON array or an NDJSON stream (one cat per line).
+
+    Rows that fail validation are returned in `errors` by their position in the input, all other rows are created.
+    """
+    try:
+        return ModelResponse(
+            await cat_spy_service.bulk_create(
+                iter_bulk_rows(request, schema=SpyCatCreateSchema, max_rows=config.bulk_max_rows)
+            )
+        )
+    except InvalidPayloadError as err:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=str(err),
+        ) from err
+
+
+@router.get('', response_model=PaginatedResponseSchema[SpyCatListResponseSchema], responses=NOT_MODIFIED_RESPONSES)
 async def get_cats_list(
     request: Request,
-    pagination_params: Annotated[LimitOffsetImplPaginationParams, Depends(limit_offset_pagination_dependency)],
-    cat_spy_service: Annotated[CatSpyService, Depends()],
+    pagination_params: Annotated[PaginationParams, Depends(pagination_dependency)],
+    ids: Annotated[list[int] | None, Depends(ids_dependency)],
+    cat_spy_service: Annotated[CatSpyService, Depends(get_cat_spy_read_service)],
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
-    cats, count = await cat_spy_service.get_paginated(pagination_params=pagination_params)
-    return PaginatedResponseSchema[SpyCatListResponseSchema](
-        results=cats,
-        next_url=build_next_url(
+    """List spy cats one page at a time, or with `ids` exactly the requested cats as a single page."""
+    if ids is None:
+        cats, page_info = await cat_spy_service.get_paginated(pagination_params=pagination_params)
+        next_url = build_next_url(
             pagination_params=pagination_params,
             request=request,
-            total_count=count,
-        ),
-    )
+            page_info=page_info,
+        )
+        total_count = page_info.total_count
+    else:
+        cats, next_url, total_count = await cat_spy_service.get_by_ids(ids), None, None
+    page = PaginatedResponseSchema[SpyCatListResponseSchema](results=cats, next_url=next_url)
+    etag = page_etag(page.results, page.next_url, total_count)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response = ModelResponse(page, headers={ETAG_HEADER: etag})
+    if total_count is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(total_count)
+    return response
+
+
+@router.get(
+    '/export',
+    response_class=StreamingResponse,
+    responses={
+        HTTPStatus.OK: {'content': {NDJSON_MEDIA_TYPE: {'schema': SpyCatDetailResponseSchema.model_json_schema()}}}
+    },
+)
+async def export_cats(cat_spy_service: Annotated[CatSpyService, Depends(get_cat_spy_read_service)]):
+    """Stream every cat as NDJSON (one cat per line, in id order)."""
+    return StreamingResponse(iter_ndjson(cat_spy_service.export()), media_type=NDJSON_MEDIA_TYPE)
 
 
-@router.get('/{cat_id}', response_model=SpyCatDetailResponseSchema)
-async def get_cat(cat_id: int, cat_spy_service: Annotated[CatSpyService, Depends()]):
+@router.get('/{cat_id}', response_model=SpyCatDetailResponseSchema, responses=NOT_MODIFIED_RESPONSES)
+async def get_cat(
+    cat_id: int,
+    cat_spy_service: Annotated[CatSpyService, Depends(get_cat_spy_read_service)],
+    if_none_match: Annotated[str | None, Header()] = None,
+):
     try:
-        return await cat_spy_service.get_by_id(cat_id)
+        if if_none_match is not None:
+            # revalidation only reads the version, the cat is loaded when it changed
+            etag = version_etag(await cat_spy_service.get_version(cat_id))
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        cat = await cat_spy_service.get_by_id(cat_id)
     except NotFoundError as err:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail='Cat not found',
         ) from err
+    return ModelResponse(cat, headers={ETAG_HEADER: version_etag(cat.version)})
 
 
 @router.patch('/{cat_id}', response_model=SpyCatDetailResponseSchema)
 async def update_cat(cat_id: int, spy_cat: SpyCatUpdateSchema, cat_spy_service: Annotated[CatSpyService, Depends()]):
     try:
-        return await cat_spy_service.update(cat_id, spy_cat)
+        return ModelResponse(await cat_spy_service.update(cat_id, spy_cat))
     except NotFoundError as err:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
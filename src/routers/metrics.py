@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+
+from src.dependencies.db import engine, read_engine
+from src.utils.metrics import (
+    breed_catalog_lookups_total,
+    breed_catalog_refreshes_total,
+    db_pool_checked_out_connections,
+    entity_cache_entries,
+    entity_cache_evictions_total,
+    entity_cache_lookups_total,
+    registry,
+)
+
+
+router = APIRouter(tags=['Metrics'])
+
+
+@router.get('/metrics', response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics(request: Request):
+    """Metrics in the Prometheus text exposition format."""
+    breed_catalog_stats = request.app.state.breed_catalog.stats
+    breed_catalog_lookups_total.set('hit', value=breed_catalog_stats.hits)
+    breed_catalog_lookups_total.set('miss', value=breed_catalog_stats.misses)
+    breed_catalog_refreshes_total.set('updated', value=breed_catalog_stats.refreshes)
+    breed_catalog_refreshes_total.set('not_modified', value=breed_catalog_stats.revalidations)
+    breed_catalog_refreshes_total.set('error', value=breed_catalog_stats.refresh_errors)
+
+    entity_cache_stats = request.app.state.entity_cache.stats
+    for namespace, hits in entity_cache_stats.hits.items():
+        entity_cache_lookups_total.set(namespace, 'hit', value=hits)
+    for namespace, misses in entity_cache_stats.misses.items():
+        entity_cache_lookups_total.set(namespace, 'miss', value=misses)
+    entity_cache_evictions_total.set(value=entity_cache_stats.evictions)
+    entity_cache_entries.set(value=entity_cache_stats.entries)
+
+    for db_engine in (engine, read_engine):
+        if hasattr(db_engine.pool, 'checkedout'):
+            db_pool_checked_out_connections.set(db_engine.pool.logging_name, value=db_engine.pool.checkedout())
+
+    return PlainTextResponse(registry.render(), media_type='text/plain; version=0.0.4; charset=utf-8')
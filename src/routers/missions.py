@@ -1,16 +1,38 @@
 from http import HTTPStatus
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
-from src.dependencies.pagination import limit_offset_pagination_dependency
-from src.errors.base import NotFoundError
+from src.dependencies.batch import ids_dependency
+from src.dependencies.pagination import pagination_dependency
+from src.dependencies.services import get_mission_read_service
+from src.errors.base import InvalidPayloadError, NotFoundError
 from src.errors.missions import AssignedMissionCannotBeDeletedError, CatAlreadyHasActiveMissionError
 from src.schemas.base import PaginatedResponseSchema
-from src.schemas.missions import MissionAssignSchema, MissionCreate, MissionDetailResponseSchema, MissionResponseSchema
+from src.schemas.missions import (
+    MissionAssignSchema,
+    MissionBulkCreateResponseSchema,
+    MissionCreate,
+    MissionDetailResponseSchema,
+    MissionResponseSchema,
+)
 from src.services.missions import MissionService
-from src.structures import LimitOffsetImplPaginationParams
-from src.utils.pagination import build_next_url
+from src.settings import config
+from src.structures import PaginationParams
+from src.utils.bulk import iter_bulk_rows
+from src.utils.etags import (
+    ETAG_HEADER,
+    NOT_MODIFIED_RESPONSES,
+    etag_matches,
+    not_modified,
+    page_etag,
+    version_etag,
+)
+from src.utils.ndjson import NDJSON_MEDIA_TYPE, iter_ndjson
+from src.utils.pagination import TOTAL_COUNT_HEADER, build_next_url
+from src.utils.responses import ModelResponse
 
 
 router = APIRouter(prefix='/missions', tags=['Missions'])
@@ -21,32 +43,120 @@ async def create_mission(mission: MissionCreate, mission_service: Annotated[Miss
     """
     Create a mission with targets (1–3 targets).
     """
-    return await mission_service.create(mission)
+    return ModelResponse(await mission_service.create(mission), status_code=HTTPStatus.CREATED)
 
 
-@router.get('', response_model=PaginatedResponseSchema[MissionResponseSchema])
+@router.post(
+    '/bulk',
+    response_model=MissionBulkCreateResponseSchema,
+    status_code=HTTPStatus.CREATED,
+    openapi_extra={
+        'requestBody': {
+            'required': True,
+            'content': {
+                'application/json': {'schema': TypeAdapter(list[MissionCreate]).json_schema()},
+                'application/x-ndjson': {'schema': MissionCreate.model_json_schema()},
+            },
+        },
+    },
+)
+async def bulk_create_missions(request: Request, mission_service: Annotated[MissionService, Depends()]):
+    """
+    Create many missions with their targets from a JSON array or an NDJSON stream (one mission per line).
+
+    Rows that fail validation are returned in `errors` by their position in the input, all other rows are created.
+    """
+    try:
+        return ModelResponse(
+            await mission_service.bulk_create(
+                iter_bulk_rows(request, schema=MissionCreate, max_rows=config.bulk_max_rows)
+            ),
+            status_code=HTTPStatus.CREATED,
+        )
+    except InvalidPayloadError as err:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=str(err),
+        ) from err
+
+
+@router.get(
+    '',
+    response_model=PaginatedResponseSchema[MissionDetailResponseSchema | MissionResponseSchema],
+    responses=NOT_MODIFIED_RESPONSES,
+)
 async def get_missions_list(
     request: Request,
-    mission_service: Annotated[MissionService, Depends()],
-    pagination_params: Annotated[LimitOffsetImplPaginationParams, Depends(limit_offset_pagination_dependency)],
+    mission_service: Annotated[MissionService, Depends(get_mission_read_service)],
+    pagination_params: Annotated[PaginationParams, Depends(pagination_dependency)],
+    ids: Annotated[list[int] | None, Depends(ids_dependency)],
+    include: Annotated[Literal['targets'] | None, Query(description='Embed the targets of every mission')] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    """
+    List missions one page at a time, or with `ids` exactly the requested missions as a single page.
+
+    `include=targets` embeds the targets of all the listed missions, loaded by one more query.
+    """
+    include_targets = include == 'targets'
+    if ids is None:
+        missions, page_info = await mission_service.get_paginated(
+            pagination_params=pagination_params, include_targets=include_targets
+        )
+        next_url = build_next_url(pagination_params=pagination_params, request=request, page_info=page_info)
+        total_count = page_info.total_count
+    else:
+        missions = await mission_service.get_by_ids(ids, include_targets=include_targets)
+        next_url, total_count = None, None
+    item_schema = MissionDetailResponseSchema if include_targets else MissionResponseSchema
+    page = PaginatedResponseSchema[item_schema](results=missions, next_url=next_url)
+    # target updates bump their mission's version, the digest only has to tell both representations apart
+    etag = page_etag(page.results, page.next_url, total_count, include_targets)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response = ModelResponse(page, headers={ETAG_HEADER: etag})
+    if total_count is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(total_count)
+    return response
+
+
+@router.get(
+    '/export',
+    response_class=StreamingResponse,
+    responses={
+        HTTPStatus.OK: {'content': {NDJSON_MEDIA_TYPE: {'schema': MissionDetailResponseSchema.model_json_schema()}}}
+    },
+)
+async def export_missions(
+    mission_service: Annotated[MissionService, Depends(get_mission_read_service)],
+    include: Annotated[Literal['targets'] | None, Query(description='Embed the targets of every mission')] = None,
 ):
-    """List all missions with their targets."""
-    missions, count = await mission_service.get_paginated(pagination_params=pagination_params)
-    return PaginatedResponseSchema[MissionResponseSchema](
-        results=missions,
-        next_url=build_next_url(pagination_params=pagination_params, request=request, total_count=count),
+    """Stream every mission as NDJSON (one mission per line, in id order)."""
+    return StreamingResponse(
+        iter_ndjson(mission_service.export(include_targets=include == 'targets')),
+        media_type=NDJSON_MEDIA_TYPE,
     )
 
 
-@router.get('/{mission_id}', response_model=MissionDetailResponseSchema)
-async def get_mission(mission_id: int, mission_service: Annotated[MissionService, Depends()]):
+@router.get('/{mission_id}', response_model=MissionDetailResponseSchema, responses=NOT_MODIFIED_RESPONSES)
+async def get_mission(
+    mission_id: int,
+    mission_service: Annotated[MissionService, Depends(get_mission_read_service)],
+    if_none_match: Annotated[str | None, Header()] = None,
+):
     try:
-        return await mission_service.get_by_id(mission_id=mission_id)
+        if if_none_match is not None:
+            # revalidation only reads the mission's version, which target updates bump as well
+            etag = version_etag(await mission_service.get_version(mission_id))
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        mission = await mission_service.get_by_id(mission_id=mission_id)
     except NotFoundError as err:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail='Mission not found',
         ) from err
+    return ModelResponse(mission, headers={ETAG_HEADER: version_etag(mission.version)})
 
 
 @router.delete('/{mission_id}', status_code=HTTPStatus.NO_CONTENT)
@@ -64,6 +174,7 @@ async def delete_mission(mission_id: int, mission_service: Annotated[MissionServ
             detail='Assigned mission cannot be deleted',
         ) from err
 
+
 @router.patch('/{mission_id}/assign', response_model=MissionResponseSchema)
 async def assign_cat_to_mission(
     mission_id: int,
@@ -71,7 +182,7 @@ async def assign_cat_to_mission(
     mission_service: Annotated[MissionService, Depends()],
 ):
     try:
-        return await mission_service.assign_cat(mission_id=mission_id, mission_to_update=mission)
+        return ModelResponse(await mission_service.assign_cat(mission_id=mission_id, mission_to_update=mission))
     except NotFoundError as err:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
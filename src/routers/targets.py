@@ -8,6 +8,7 @@ from src.errors.missions import CannotUpdateCompletedMissionError
 from src.errors.targets import CannotUpdateCompletedTargetError
 from src.schemas.targets import TargetResponseSchema, TargetUpdateSchema
 from src.services.targets import TargetService
+from src.utils.responses import ModelResponse
 
 
 router = APIRouter(tags=['Targets'])
@@ -21,7 +22,9 @@ async def update_target(
     target_service: Annotated[TargetService, Depends()],
 ):
     try:
-        return await target_service.update(mission_id=mission_id, target_id=target_id, target_to_update=target)
+        return ModelResponse(
+            await target_service.update(mission_id=mission_id, target_id=target_id, target_to_update=target)
+        )
     except NotFoundError as err:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
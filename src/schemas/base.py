@@ -1,6 +1,13 @@
+from typing import Any
+
 from pydantic import BaseModel
 
 
 class PaginatedResponseSchema[T](BaseModel):
     results: list[T]
     next_url: str | None = None
+
+
+class BulkRowErrorSchema(BaseModel):
+    index: int
+    detail: list[dict[str, Any]]
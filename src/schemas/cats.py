@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas.base import BulkRowErrorSchema
 
 
 class SpyCatBaseSchema(BaseModel):
@@ -20,9 +22,17 @@ class SpyCatUpdateSchema(BaseModel):
 
 
 class SpyCatListResponseSchema(SpyCatBaseSchema):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
+    version: int = Field(exclude=True)  # sent as the ETag header, not in the body
 
 
 class SpyCatDetailResponseSchema(SpyCatListResponseSchema):
     id: int
     years_of_experience: int
+
+
+class SpyCatBulkCreateResponseSchema(BaseModel):
+    created_ids: list[int]
+    errors: list[BulkRowErrorSchema]
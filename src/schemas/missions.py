@@ -1,5 +1,6 @@
-from pydantic import BaseModel, conlist
+from pydantic import BaseModel, ConfigDict, Field, conlist, field_validator
 
+from src.schemas.base import BulkRowErrorSchema
 from src.schemas.targets import TargetCreateSchema, TargetResponseSchema
 
 
@@ -10,10 +11,19 @@ class MissionBaseSchema(BaseModel):
 class MissionCreate(MissionBaseSchema):
     targets: conlist(item_type=TargetCreateSchema, min_length=1, max_length=3)
 
+    @field_validator('targets')
+    def validate_unique_target_names(cls, targets: list[TargetCreateSchema]) -> list[TargetCreateSchema]:
+        if len({target.name for target in targets}) != len(targets):
+            raise ValueError('Target names must be unique within a mission')
+        return targets
+
 
 class MissionResponseSchema(MissionBaseSchema):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     cat_id: int | None = None
+    version: int = Field(exclude=True)
 
 
 class MissionDetailResponseSchema(MissionResponseSchema):
@@ -22,3 +32,8 @@ class MissionDetailResponseSchema(MissionResponseSchema):
 
 class MissionAssignSchema(BaseModel):
     cat_id: int
+
+
+class MissionBulkCreateResponseSchema(BaseModel):
+    created_ids: list[int]
+    errors: list[BulkRowErrorSchema]
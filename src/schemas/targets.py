@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TargetBaseSchema(BaseModel):
@@ -18,4 +18,6 @@ class TargetUpdateSchema(BaseModel):
 
 
 class TargetResponseSchema(TargetBaseSchema):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
@@ -0,0 +1,194 @@
+import asyncio
+import contextlib
+import logging
+import os
+import time
+import unicodedata
+from datetime import UTC, datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Awaitable, Callable
+
+from pydantic import BaseModel, ValidationError
+
+from src.repositories.rest_api.structures import BreedCatalogSnapshot, CatBreed
+
+
+logger = logging.getLogger(__name__)
+
+
+class BreedCatalogStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    revalidations: int = 0  # upstream answered "not modified"
+    refresh_errors: int = 0
+
+
+def normalize_breed_name(name: str) -> str:
+    return ' '.join(unicodedata.normalize('NFKC', name).casefold().split())
+
+
+class BreedIndex:
+    """Immutable lookup of normalized primary and alternative breed names to the canonical breed."""
+
+    __slots__ = ('_breeds_by_name',)
+
+    def __init__(self, breeds: list[CatBreed]):
+        breeds_by_name = {}
+        for breed in breeds:
+            for alt_name in breed.alt_names:
+                breeds_by_name.setdefault(normalize_breed_name(alt_name), breed)
+        # primary names win over an alternative name of another breed
+        breeds_by_name.update({normalize_breed_name(breed.name): breed for breed in breeds})
+        self._breeds_by_name = MappingProxyType(breeds_by_name)
+
+    def __len__(self) -> int:
+        return len(self._breeds_by_name)
+
+    def resolve(self, name: str) -> CatBreed | None:
+        return self._breeds_by_name.get(normalize_breed_name(name))
+
+
+class BreedCatalogService:
+    """
+    Process-wide catalog of TheCatAPI breeds.
+
+    One instance lives for the whole application (see `src.main.lifespan`): it is warmed at startup,
+    refreshed in the background shortly before it expires and keeps serving the previous copy while a
+    refresh is in flight. Concurrent cold misses share a single upstream fetch.
+
+    When `snapshot_path` is set the catalog is also persisted to disk, so a new worker boots from the
+    snapshot and only revalidates it against the upstream (by ETag) in the background.
+    """
+
+    def __init__(
+        self,
+        fetch_snapshot: Callable[[str | None], Awaitable[BreedCatalogSnapshot | None]],
+        ttl: float,
+        refresh_ahead: float,
+        retry_interval: float,
+        snapshot_path: Path | None = None,
+    ):
+        self._fetch_snapshot = fetch_snapshot
+        self._ttl = ttl
+        # at most half the ttl, so a fresh copy is never already due for its next refresh
+        self._refresh_ahead = min(refresh_ahead, ttl / 2)
+        self._retry_interval = retry_interval
+        self._snapshot_path = snapshot_path
+
+        self._snapshot: BreedCatalogSnapshot | None = None
+        self._index: BreedIndex | None = None
+        self._fetched_at: float | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._background_task: asyncio.Task | None = None
+        self._stats = BreedCatalogStats()
+
+    @property
+    def stats(self) -> BreedCatalogStats:
+        return self._stats.model_copy()
+
+    @property
+    def is_stale(self) -> bool:
+        return self._fetched_at is None or time.monotonic() - self._fetched_at >= self._ttl
+
+    async def get_index(self) -> BreedIndex:
+        await self._ensure_loaded()
+        return self._index
+
+    async def _ensure_loaded(self) -> None:
+        if self._snapshot is None:
+            self._stats.misses += 1
+            await asyncio.shield(self._refresh())
+            return
+
+        self._stats.hits += 1
+        if self.is_stale:
+            # stale-while-revalidate: answer with what we have, refresh behind the caller's back
+            self._refresh()
+
+    async def start(self) -> None:
+        if self._snapshot_path is not None:
+            await asyncio.to_thread(self._load_snapshot)
+        if self._snapshot is None:
+            with contextlib.suppress(Exception):
+                await self._refresh()
+        self._background_task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        for task in (self._background_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._background_task = None
+        self._refresh_task = None
+
+    def _refresh(self) -> asyncio.Task:
+        """Start a refresh unless one is already running (single flight)."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._do_refresh())
+            self._refresh_task.add_done_callback(self._log_refresh_failure)
+        return self._refresh_task
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error('Breed catalog refresh failed', exc_info=task.exception())
+
+    async def _do_refresh(self) -> None:
+        current = self._snapshot
+        try:
+            snapshot = await self._fetch_snapshot(current.etag if current else None)
+        except Exception:
+            self._stats.refresh_errors += 1
+            raise
+
+        if snapshot is None:
+            # not modified upstream, the copy we have is good for another ttl
+            snapshot = current.model_copy(update={'fetched_at': datetime.now(UTC)})
+            self._stats.revalidations += 1
+        else:
+            self._index = BreedIndex(snapshot.breeds)
+            self._stats.refreshes += 1
+        self._snapshot = snapshot
+        self._fetched_at = time.monotonic()
+
+        if self._snapshot_path is not None:
+            try:
+                await asyncio.to_thread(self._save_snapshot, snapshot)
+            except OSError:
+                logger.exception('Could not write breed catalog snapshot to %s', self._snapshot_path)
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            if self._fetched_at is None:
+                delay = self._retry_interval
+            else:
+                refresh_at = self._fetched_at + self._ttl - self._refresh_ahead
+                delay = max(refresh_at - time.monotonic(), 0)
+            await asyncio.sleep(delay)
+            try:
+                await self._refresh()
+            except Exception:
+                await asyncio.sleep(self._retry_interval)
+
+    def _load_snapshot(self) -> None:
+        try:
+            snapshot = BreedCatalogSnapshot.model_validate_json(self._snapshot_path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, ValidationError):
+            logger.exception('Ignoring unreadable breed catalog snapshot %s', self._snapshot_path)
+            return
+
+        age = max((datetime.now(UTC) - snapshot.fetched_at).total_seconds(), 0)
+        self._index = BreedIndex(snapshot.breeds)
+        self._snapshot = snapshot
+        self._fetched_at = time.monotonic() - age
+
+    def _save_snapshot(self, snapshot: BreedCatalogSnapshot) -> None:
+        # write + rename, so other workers never read a half-written file
+        tmp_path = self._snapshot_path.with_name(f'{self._snapshot_path.name}.{os.getpid()}.tmp')
+        tmp_path.write_text(snapshot.model_dump_json(exclude_none=True))
+        tmp_path.replace(self._snapshot_path)
@@ -1,84 +1,129 @@
-import itertools
-from typing import TYPE_CHECKING, Annotated
+from typing import Annotated, AsyncIterator
 
-from async_lru import alru_cache
 from fastapi import Depends
+from pydantic import TypeAdapter
 
+from src.dependencies.breeds import get_breed_catalog
+from src.dependencies.cache import get_entity_cache
 from src.errors.cats import CatNotFoundError, InvalidBreedError
 from src.models import SpyCat
-from src.repositories.rest_api.breads_api import TheCatApiRepository
 from src.repositories.sql_repos.cats import CatSpyRepository
+from src.schemas.base import BulkRowErrorSchema
 from src.schemas.cats import (
+    SpyCatBulkCreateResponseSchema,
     SpyCatCreateSchema,
     SpyCatDetailResponseSchema,
     SpyCatListResponseSchema,
     SpyCatUpdateSchema,
 )
-from src.structures import LimitOffsetImplPaginationParams
+from src.services.breeds import BreedCatalogService
+from src.services.entity_cache import CAT_NAMESPACE, MISSION_NAMESPACE, EntityCache
+from src.settings import config
+from src.structures import PageInfo, PaginationParams
+from src.utils.bulk import BulkRow
 
 
-if TYPE_CHECKING:
-    from src.repositories.rest_api.structures import CatBreed
+# one validator call per page instead of one per row
+cat_list_adapter = TypeAdapter(list[SpyCatListResponseSchema])
 
 
 class CatSpyService:
     def __init__(
         self,
         cat_spy_repository: Annotated[CatSpyRepository, Depends()],
-        the_cat_api_repository: Annotated[TheCatApiRepository, Depends()],
+        breed_catalog: Annotated[BreedCatalogService, Depends(get_breed_catalog)],
+        entity_cache: Annotated[EntityCache, Depends(get_entity_cache)],
     ):
         self._cat_spy_repository = cat_spy_repository
-        self._the_cat_api_repository = the_cat_api_repository
+        self._breed_catalog = breed_catalog
+        self._entity_cache = entity_cache
 
     async def create(self, cat: SpyCatCreateSchema) -> SpyCatDetailResponseSchema:
-        allowed_cat_breeds = await self.get_unique_breeds_names()
-        allowed_alternative_breeds = await self.get_unique_alternative_breed_names()
-        if cat.breed not in allowed_cat_breeds | allowed_alternative_breeds:
+        breed_index = await self._breed_catalog.get_index()
+        breed = breed_index.resolve(cat.breed)
+        if breed is None:
             raise InvalidBreedError
 
         cat_to_create = SpyCat(
             name=cat.name,
-            breed=cat.breed,
+            breed=breed.name,
             years_of_experience=cat.years_of_experience,
             salary=cat.salary,
         )
         cat = await self._cat_spy_repository.create(cat_to_create)
-        return SpyCatDetailResponseSchema(
-            id=cat.id,
-            name=cat.name,
-            breed=cat.breed,
-            years_of_experience=cat.years_of_experience,
-            salary=cat.salary,
-        )
+        return SpyCatDetailResponseSchema.model_validate(cat)
 
-    async def get_paginated(
-        self, pagination_params: LimitOffsetImplPaginationParams
-    ) -> tuple[list[SpyCatListResponseSchema], int]:
-        count = await self._cat_spy_repository.get_count()
-        if not count:
-            return [], 0
-        cats = await self._cat_spy_repository.get_paginated(pagination_params=pagination_params)
-        return [
-            SpyCatListResponseSchema(
-                id=cat.id,
-                name=cat.name,
-                breed=cat.breed,
-                salary=cat.salary,
+    async def bulk_create(self, rows: AsyncIterator[BulkRow[SpyCatCreateSchema]]) -> SpyCatBulkCreateResponseSchema:
+        """
+        Create cats in chunked multi-row inserts inside a single transaction.
+
+        Invalid rows (schema or breed) are reported by index and skipped, the rest of the batch is still created.
+        """
+        breed_index = await self._breed_catalog.get_index()
+        created_ids = []
+        errors = []
+        chunk = []
+        async for index, cat, row_errors in rows:
+            if row_errors is not None:
+                errors.append(BulkRowErrorSchema(index=index, detail=row_errors))
+                continue
+            breed = breed_index.resolve(cat.breed)
+            if breed is None:
+                errors.append(
+                    BulkRowErrorSchema(
+                        index=index,
+                        detail=[{'type': 'invalid_breed', 'loc': ['breed'], 'msg': 'Invalid breed'}],
+                    )
+                )
+                continue
+
+            chunk.append(
+                {
+                    'name': cat.name,
+                    'breed': breed.name,
+                    'years_of_experience': cat.years_of_experience,
+                    'salary': cat.salary,
+                }
             )
-            for cat in cats
-        ], count
+            if len(chunk) >= config.bulk_insert_chunk_size:
+                created_ids.extend(await self._cat_spy_repository.insert_many(chunk))
+                chunk = []
+
+        if chunk:
+            created_ids.extend(await self._cat_spy_repository.insert_many(chunk))
+        await self._cat_spy_repository.commit()
+        return SpyCatBulkCreateResponseSchema(created_ids=sorted(created_ids), errors=errors)
+
+    async def export(self) -> AsyncIterator[list[dict]]:
+        """All cats in id order, in chunks of plain dicts shaped like `SpyCatDetailResponseSchema`."""
+        async for rows in self._cat_spy_repository.stream_rows(chunk_size=config.export_chunk_size):
+            yield [dict(row) for row in rows]
+
+    async def get_paginated(
+        self, pagination_params: PaginationParams
+    ) -> tuple[list[SpyCatListResponseSchema], PageInfo]:
+        cats, page_info = await self._cat_spy_repository.get_paginated(pagination_params=pagination_params)
+        return cat_list_adapter.validate_python(cats), page_info
+
+    async def get_by_ids(self, cat_ids: list[int]) -> list[SpyCatListResponseSchema]:
+        """Cats with the given ids in their order, unknown ids skipped, from one query that bypasses the cache."""
+        cats = await self._cat_spy_repository.get_by_ids(cat_ids)
+        return cat_list_adapter.validate_python(cats)
+
+    async def get_version(self, cat_id: int) -> int:
+        version = await self._cat_spy_repository.get_version(cat_id)
+        if version is None:
+            raise CatNotFoundError
+        return version
 
     async def get_by_id(self, cat_id: int) -> SpyCatDetailResponseSchema:
+        return await self._entity_cache.get_or_load(CAT_NAMESPACE, cat_id, lambda: self._load_by_id(cat_id))
+
+    async def _load_by_id(self, cat_id: int) -> SpyCatDetailResponseSchema:
         cat = await self._cat_spy_repository.get_by_id(cat_id)
         if cat is None:
             raise CatNotFoundError
-        return SpyCatDetailResponseSchema(
-            id=cat.id,
-            name=cat.name,
-            breed=cat.breed,
-            years_of_experience=cat.years_of_experience,
-            salary=cat.salary,
-        )
+        return SpyCatDetailResponseSchema.model_validate(cat)
 
     async def update(self, cat_id: int, cat_to_update: SpyCatUpdateSchema) -> SpyCatDetailResponseSchema:
         cat = await self._cat_spy_repository.get_by_id(cat_id)
@@ -86,28 +131,13 @@ class CatSpyService:
             raise CatNotFoundError
         cat.salary = cat_to_update.salary
         cat = await self._cat_spy_repository.update(entity=cat)
-        return SpyCatDetailResponseSchema(
-            id=cat.id,
-            name=cat.name,
-            breed=cat.breed,
-            years_of_experience=cat.years_of_experience,
-            salary=cat.salary,
-        )
+        await self._entity_cache.invalidate(CAT_NAMESPACE, cat_id)
+        return SpyCatDetailResponseSchema.model_validate(cat)
 
     async def delete(self, cat_id: int):
         is_deleted = await self._cat_spy_repository.delete(cat_id)
         if not is_deleted:
             raise CatNotFoundError
-
-    async def get_breeds(self) -> list['CatBreed']:
-        return await self._the_cat_api_repository.get_all_breds()
-
-    @alru_cache(maxsize=1, ttl=3600)
-    async def get_unique_breeds_names(self) -> set[str]:
-        breeds = await self.get_breeds()
-        return {breed.name for breed in breeds}
-
-    @alru_cache(maxsize=1, ttl=3600)
-    async def get_unique_alternative_breed_names(self) -> set[str]:
-        breeds = await self.get_breeds()
-        return set(itertools.chain.from_iterable(breed.alt_names for breed in breeds))
+        await self._entity_cache.invalidate(CAT_NAMESPACE, cat_id)
+        # the cat's missions went with it
+        await self._entity_cache.invalidate_namespace(MISSION_NAMESPACE)
@@ -0,0 +1,92 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from pydantic import BaseModel
+
+
+CAT_NAMESPACE = 'cats'
+MISSION_NAMESPACE = 'missions'
+
+
+class EntityCacheStats(BaseModel):
+    hits: dict[str, int] = {}  # per namespace
+    misses: dict[str, int] = {}
+    evictions: int = 0  # entries dropped to stay under max_entries
+    entries: int = 0
+
+
+class EntityCache(ABC):
+    """
+    Read-through cache of entity detail responses, keyed by namespace (see the `*_NAMESPACE` constants) and id.
+
+    Services read through `get_or_load` and invalidate after every committed write to an entity. The interface is
+    async so a shared backend (e.g. Redis) can implement it; `InMemoryEntityCache` is local to one worker, other
+    workers may serve an entry changed elsewhere until its TTL runs out.
+    """
+
+    @property
+    @abstractmethod
+    def stats(self) -> EntityCacheStats: ...
+
+    @abstractmethod
+    async def get_or_load[M: BaseModel](self, namespace: str, key: int, load: Callable[[], Awaitable[M]]) -> M:
+        """Return the cached value or `load()` and cache it; exceptions from `load` are raised and not cached."""
+
+    @abstractmethod
+    async def invalidate(self, namespace: str, key: int) -> None: ...
+
+    @abstractmethod
+    async def invalidate_namespace(self, namespace: str) -> None: ...
+
+
+class InMemoryEntityCache(EntityCache):
+    """
+    Process-local LRU cache with a TTL per entry and at most `max_entries` entries (`0` disables caching).
+
+    Cached values are shared between requests and must not be mutated. A value loaded while an invalidation
+    happened is returned but not stored, so a read racing a write cannot put the old version back.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple[str, int], tuple[float, BaseModel]] = OrderedDict()
+        self._generation = 0  # bumped by every invalidation
+        self._stats = EntityCacheStats()
+
+    @property
+    def stats(self) -> EntityCacheStats:
+        return self._stats.model_copy(update={'entries': len(self._entries)}, deep=True)
+
+    async def get_or_load[M: BaseModel](self, namespace: str, key: int, load: Callable[[], Awaitable[M]]) -> M:
+        entry_key = (namespace, key)
+        entry = self._entries.get(entry_key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(entry_key)
+                self._stats.hits[namespace] = self._stats.hits.get(namespace, 0) + 1
+                return value
+            del self._entries[entry_key]
+
+        self._stats.misses[namespace] = self._stats.misses.get(namespace, 0) + 1
+        generation = self._generation
+        value = await load()
+        if generation == self._generation and self._max_entries > 0:
+            self._entries[entry_key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+        return value
+
+    async def invalidate(self, namespace: str, key: int) -> None:
+        self._generation += 1
+        self._entries.pop((namespace, key), None)
+
+    async def invalidate_namespace(self, namespace: str) -> None:
+        self._generation += 1
+        for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == namespace]:
+            del self._entries[entry_key]
@@ -1,18 +1,38 @@
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
 from fastapi import Depends
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
 
+from src.dependencies.cache import get_entity_cache
 from src.errors.cats import CatNotFoundError
-from src.errors.missions import MissionNotFoundError, AssignedMissionCannotBeDeletedError, \
-    CatAlreadyHasActiveMissionError
+from src.errors.missions import (
+    AssignedMissionCannotBeDeletedError,
+    CatAlreadyHasActiveMissionError,
+    MissionNotFoundError,
+)
 from src.models.missions import Mission
 from src.models.targets import Target
 from src.repositories.sql_repos.cats import CatSpyRepository
-from src.repositories.sql_repos.missions import MissionRepository
+from src.repositories.sql_repos.missions import ACTIVE_CAT_CONFLICT, MissionRepository
 from src.repositories.sql_repos.targets import TargetRepository
-from src.schemas.missions import MissionAssignSchema, MissionCreate, MissionDetailResponseSchema, MissionResponseSchema
-from src.schemas.targets import TargetResponseSchema
-from src.structures import LimitOffsetImplPaginationParams
+from src.schemas.base import BulkRowErrorSchema
+from src.schemas.missions import (
+    MissionAssignSchema,
+    MissionBulkCreateResponseSchema,
+    MissionCreate,
+    MissionDetailResponseSchema,
+    MissionResponseSchema,
+)
+from src.services.entity_cache import MISSION_NAMESPACE, EntityCache
+from src.settings import config
+from src.structures import PageInfo, PaginationParams
+from src.utils.bulk import BulkRow
+
+
+# one validator call per page instead of one per row
+mission_list_adapter = TypeAdapter(list[MissionResponseSchema])
+mission_detail_list_adapter = TypeAdapter(list[MissionDetailResponseSchema])
 
 
 class MissionService:
@@ -21,118 +41,164 @@ class MissionService:
         cat_repository: Annotated[CatSpyRepository, Depends()],
         mission_repository: Annotated[MissionRepository, Depends()],
         target_repository: Annotated[TargetRepository, Depends()],
+        entity_cache: Annotated[EntityCache, Depends(get_entity_cache)],
     ):
         self._cat_repository = cat_repository
         self._mission_repository = mission_repository
         self._target_repository = target_repository
+        self._entity_cache = entity_cache
 
     async def create(self, mission: MissionCreate) -> MissionDetailResponseSchema:
-        mission_to_create = Mission(completed=mission.completed)
-        created_mission = await self._mission_repository.create(mission_to_create)
-        targets_to_create = [
-            Target(
-                name=target.name,
-                country=target.country,
-                notes=target.notes,
-                completed=target.completed,
-                mission_id=created_mission.id,
-            )
-            for target in mission.targets
-        ]
-        targets = await self._target_repository.bulk_create(entities=targets_to_create)
-
-        return MissionDetailResponseSchema(
-            id=created_mission.id,
-            completed=created_mission.completed,
-            cat_id=created_mission.cat_id,
+        [created_mission] = await self._mission_repository.insert_with_targets([self._build_mission(mission)])
+        await self._mission_repository.commit()
+        return self._build_detail_response(created_mission, created_mission.targets)
+
+    async def bulk_create(self, rows: AsyncIterator[BulkRow[MissionCreate]]) -> MissionBulkCreateResponseSchema:
+        """
+        Create missions with their targets in chunks inside a single transaction.
+
+        Invalid rows are reported by index and skipped, the rest of the batch is still created.
+        """
+        created_ids = []
+        errors = []
+        chunk = []
+        async for index, mission, row_errors in rows:
+            if row_errors is not None:
+                errors.append(BulkRowErrorSchema(index=index, detail=row_errors))
+                continue
+            chunk.append(self._build_mission(mission))
+            if len(chunk) >= config.bulk_insert_chunk_size:
+                created = await self._mission_repository.insert_with_targets(chunk)
+                created_ids.extend(created_mission.id for created_mission in created)
+                chunk = []
+
+        if chunk:
+            created = await self._mission_repository.insert_with_targets(chunk)
+            created_ids.extend(created_mission.id for created_mission in created)
+        await self._mission_repository.commit()
+        return MissionBulkCreateResponseSchema(created_ids=created_ids, errors=errors)
+
+    @staticmethod
+    def _build_mission(mission: MissionCreate) -> Mission:
+        return Mission(
+            completed=mission.completed,
             targets=[
-                TargetResponseSchema(
-                    id=target.id,
+                Target(
                     name=target.name,
                     country=target.country,
                     notes=target.notes,
                     completed=target.completed,
                 )
-                for target in targets
+                for target in mission.targets
             ],
         )
 
+    @staticmethod
+    def _detail_fields(mission: Mission, targets: list[Target]) -> dict:
+        # a dict, so `mission.targets` (a lazy relationship) is never touched
+        return {
+            'id': mission.id,
+            'completed': mission.completed,
+            'cat_id': mission.cat_id,
+            'version': mission.version,
+            'targets': targets,
+        }
+
+    def _build_detail_response(self, mission: Mission, targets: list[Target]) -> MissionDetailResponseSchema:
+        return MissionDetailResponseSchema.model_validate(self._detail_fields(mission, targets))
+
+    async def _build_responses(
+        self, missions: list[Mission], *, include_targets: bool
+    ) -> list[MissionResponseSchema] | list[MissionDetailResponseSchema]:
+        """With `include_targets` the targets of all the missions are loaded by one more query, not one per mission."""
+        if not include_targets:
+            return mission_list_adapter.validate_python(missions)
+
+        targets_by_mission_id = {mission.id: [] for mission in missions}
+        if missions:
+            for target in await self._target_repository.get_by_mission_ids(list(targets_by_mission_id)):
+                targets_by_mission_id[target.mission_id].append(target)
+        return mission_detail_list_adapter.validate_python(
+            [self._detail_fields(mission, targets_by_mission_id[mission.id]) for mission in missions]
+        )
+
+    async def export(self, *, include_targets: bool = False) -> AsyncIterator[list[dict]]:
+        """
+        All missions in id order, in chunks of plain dicts shaped like `MissionResponseSchema`.
+
+        With `include_targets` every chunk costs one more query, for the targets of the chunk's id range, and
+        the dicts are shaped like `MissionDetailResponseSchema`.
+        """
+        async for rows in self._mission_repository.stream_rows(chunk_size=config.export_chunk_size):
+            missions = [dict(row) for row in rows]
+            if include_targets:
+                targets_by_mission_id = {mission['id']: [] for mission in missions}
+                target_rows = await self._target_repository.get_rows_by_mission_id_range(
+                    first_mission_id=missions[0]['id'], last_mission_id=missions[-1]['id']
+                )
+                for target in target_rows:
+                    target = dict(target)
+                    targets_by_mission_id[target.pop('mission_id')].append(target)
+                for mission in missions:
+                    mission['targets'] = targets_by_mission_id[mission['id']]
+            yield missions
+
     async def get_paginated(
-        self, pagination_params: LimitOffsetImplPaginationParams
-    ) -> tuple[list[MissionResponseSchema], int]:
-        count = await self._mission_repository.get_count()
-        if not count:
-            return [], 0
-        missions = await self._mission_repository.get_paginated(pagination_params=pagination_params)
-
-        return [
-            MissionResponseSchema(
-                id=mission.id,
-                completed=mission.completed,
-                cat_id=mission.cat_id,
-            )
-            for mission in missions
-        ], count
+        self, pagination_params: PaginationParams, *, include_targets: bool = False
+    ) -> tuple[list[MissionResponseSchema] | list[MissionDetailResponseSchema], PageInfo]:
+        missions, page_info = await self._mission_repository.get_paginated(pagination_params=pagination_params)
+        return await self._build_responses(missions, include_targets=include_targets), page_info
+
+    async def get_by_ids(
+        self, mission_ids: list[int], *, include_targets: bool = False
+    ) -> list[MissionResponseSchema] | list[MissionDetailResponseSchema]:
+        """Missions with the given ids in their order, unknown ids skipped, from one query that bypasses the cache."""
+        missions = await self._mission_repository.get_by_ids(mission_ids)
+        return await self._build_responses(missions, include_targets=include_targets)
+
+    async def get_version(self, mission_id: int) -> int:
+        """Current version of the mission, from the table alone; see `get_by_id` for the details."""
+        version = await self._mission_repository.get_version(mission_id)
+        if version is None:
+            raise MissionNotFoundError
+        return version
 
     async def get_by_id(self, mission_id: int) -> MissionDetailResponseSchema:
+        return await self._entity_cache.get_or_load(MISSION_NAMESPACE, mission_id, lambda: self._load_by_id(mission_id))
+
+    async def _load_by_id(self, mission_id: int) -> MissionDetailResponseSchema:
         mission = await self._mission_repository.get_by_id(mission_id)
         if mission is None:
             raise MissionNotFoundError
 
         targets = await self._target_repository.get_by_mission_id(mission_id=mission_id)
-
-        return MissionDetailResponseSchema(
-            id=mission.id,
-            completed=mission.completed,
-            cat_id=mission.cat_id,
-            targets=[
-                TargetResponseSchema(
-                    id=target.id,
-                    name=target.name,
-                    country=target.country,
-                    notes=target.notes,
-                    completed=target.completed,
-                )
-                for target in targets
-            ],
-        )
-
-    async def assign_cat(self, mission_id: int, mission_to_update: MissionAssignSchema) -> MissionDetailResponseSchema:
-        cat = await self._cat_repository.get_by_id(mission_to_update.cat_id)
-        if cat is None:
-            raise CatNotFoundError
-        active_missions = await self._mission_repository.get_active_missions_by_cat_id(cat_id=cat.id)
-        if active_missions:
-            raise CatAlreadyHasActiveMissionError
-        mission = await self._mission_repository.get_by_id(mission_id)
+        return self._build_detail_response(mission, targets)
+
+    async def assign_cat(self, mission_id: int, mission_to_update: MissionAssignSchema) -> MissionResponseSchema:
+        """Compare-and-set assignment: one self-committing conditional UPDATE, lookups only explain a failure."""
+        cat_id = mission_to_update.cat_id
+        try:
+            mission = await self._mission_repository.assign_cat(mission_id=mission_id, cat_id=cat_id)
+        except IntegrityError as err:
+            # should the conditional UPDATE ever let a second active mission through; anything else is a real error
+            if ACTIVE_CAT_CONFLICT not in str(err.orig):
+                raise
+            raise CatAlreadyHasActiveMissionError from err
         if mission is None:
-            raise MissionNotFoundError
+            if await self._cat_repository.get_version(cat_id) is None:
+                raise CatNotFoundError
+            if await self._mission_repository.get_version(mission_id) is None:
+                raise MissionNotFoundError
+            raise CatAlreadyHasActiveMissionError
 
-        mission.cat_id = mission_to_update.cat_id
-        updated_mission = await self._mission_repository.update(entity=mission)
-        targets = await self._target_repository.get_by_mission_id(mission_id=mission_id)
-        return MissionDetailResponseSchema(
-            id=updated_mission.id,
-            completed=updated_mission.completed,
-            cat_id=updated_mission.cat_id,
-            targets=[
-                TargetResponseSchema(
-                    id=target.id,
-                    name=target.name,
-                    country=target.country,
-                    notes=target.notes,
-                    completed=target.completed,
-                )
-                for target in targets
-            ],
-        )
+        await self._entity_cache.invalidate(MISSION_NAMESPACE, mission_id)
+        return MissionResponseSchema.model_validate(mission)
 
     async def delete(self, mission_id: int) -> None:
-        mission = await self._mission_repository.get_by_id(mission_id)
-        if mission is None:
-            raise MissionNotFoundError
-
-        if mission.cat_id is not None:
+        is_deleted = await self._mission_repository.delete(mission_id, cat_id=None)
+        if not is_deleted:
+            if await self._mission_repository.get_version(mission_id) is None:
+                raise MissionNotFoundError
             raise AssignedMissionCannotBeDeletedError
 
-        await self._mission_repository.delete(mission_id)
+        await self._entity_cache.invalidate(MISSION_NAMESPACE, mission_id)
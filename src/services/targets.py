@@ -2,11 +2,14 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from src.dependencies.cache import get_entity_cache
 from src.errors.missions import MissionNotFoundError, CannotUpdateCompletedMissionError
 from src.errors.targets import TargetNotFoundError, CannotUpdateCompletedTargetError
+from src.models.targets import Target
 from src.repositories.sql_repos.missions import MissionRepository
 from src.repositories.sql_repos.targets import TargetRepository
 from src.schemas.targets import TargetResponseSchema, TargetUpdateSchema
+from src.services.entity_cache import MISSION_NAMESPACE, EntityCache
 
 
 class TargetService:
@@ -14,9 +17,11 @@ class TargetService:
         self,
         target_repository: Annotated[TargetRepository, Depends()],
         mission_repository: Annotated[MissionRepository, Depends()],
+        entity_cache: Annotated[EntityCache, Depends(get_entity_cache)],
     ):
         self._target_repository = target_repository
         self._mission_repository = mission_repository
+        self._entity_cache = entity_cache
 
     async def update(
         self,
@@ -24,34 +29,41 @@ class TargetService:
         target_id: int,
         target_to_update: TargetUpdateSchema,
     ) -> TargetResponseSchema:
+        """
+        Update the target and complete the mission with its last open target, in one transaction.
+
+        A guarded UPDATE of the target and one UPDATE of the mission, so concurrent updates of a mission's targets
+        cannot leave it open with every target completed. Only when the target does not qualify is the reason
+        looked up. A payload without changes writes nothing, so versions and cached missions stay as they are.
+        """
+        values = target_to_update.model_dump(exclude_none=True)
+        if not values:
+            return TargetResponseSchema.model_validate(await self._get_open_target(mission_id, target_id))
+
+        target = await self._target_repository.update_open(mission_id=mission_id, target_id=target_id, values=values)
+        if target is None:
+            await self._target_repository.rollback()
+            await self._get_open_target(mission_id, target_id)
+            # completed targets and missions are never reopened, so the lookup has raised the reason already
+            raise CannotUpdateCompletedTargetError
+
+        await self._mission_repository.sync_completion(mission_id)
+        await self._mission_repository.commit()
+        # mission details embed their targets
+        await self._entity_cache.invalidate(MISSION_NAMESPACE, mission_id)
+
+        return TargetResponseSchema.model_validate(target)
+
+    async def _get_open_target(self, mission_id: int, target_id: int) -> Target:
+        """The target when it can be updated, otherwise the error telling why not."""
         mission = await self._mission_repository.get_by_id(mission_id)
         if mission is None:
             raise MissionNotFoundError
-
         target = await self._target_repository.get_by_id(target_id)
-
         if not target or mission_id != target.mission_id:
             raise TargetNotFoundError
         if mission.completed:
             raise CannotUpdateCompletedMissionError
         if target.completed:
             raise CannotUpdateCompletedTargetError
-
-        if target_to_update.notes is not None:
-            target.notes = target_to_update.notes
-        if target_to_update.completed is not None:
-            target.completed = target_to_update.completed
-
-        updated_target = await self._target_repository.update(entity=target)
-        all_mission_targets = await self._target_repository.get_by_mission_id(mission_id)
-        if all(target.completed for target in all_mission_targets):
-            mission.completed = True
-            await self._mission_repository.update(entity=mission)
-
-        return TargetResponseSchema(
-            id=updated_target.id,
-            name=updated_target.name,
-            country=updated_target.country,
-            notes=updated_target.notes,
-            completed=updated_target.completed,
-        )
+        return target
@@ -1,8 +1,65 @@
+from pathlib import Path
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Config(BaseSettings):
     db_url: str = 'sqlite+aiosqlite:///./spy_cats.db'
+    db_read_url: str | None = None  # defaults to db_url opened read-only
+    db_pool_size: int = 5
+    db_read_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_echo: bool = False
+    db_slow_query_threshold_ms: float | None = 100.0  # unset to disable the slow query log
+
+    # per-request query budget and N+1 detection, meant for development and CI
+    query_budget_mode: Literal['off', 'log', 'raise'] = 'off'
+    query_budget_default: int | None = 10  # max SQL statements per request, unset for no limit
+    query_budgets: dict[str, int] = {}  # per route, keyed like "GET /cats/{cat_id}"
+    query_repeat_threshold: int = 5  # the same statement shape this many times in one request looks like N+1
+    # statements grow with the request body here (one per chunk of rows): no default budget and no repeat check
+    query_budget_exempt_routes: set[str] = {'POST /cats/bulk', 'POST /missions/bulk'}
+
+    # SQLite tuning profile, applied to every new connection
+    sqlite_journal_mode: Literal['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'] = 'WAL'
+    sqlite_synchronous: Literal['OFF', 'NORMAL', 'FULL', 'EXTRA'] = 'NORMAL'
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size: int = -64000  # negative values are KiB, i.e. 64 MiB per connection
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_temp_store: Literal['DEFAULT', 'FILE', 'MEMORY'] = 'MEMORY'
+    sqlite_foreign_keys: bool = True
+    sqlite_wal_checkpoint_mode: Literal['PASSIVE', 'FULL', 'RESTART', 'TRUNCATE'] = 'PASSIVE'
+    sqlite_wal_checkpoint_interval: float = 300.0  # seconds, 0 disables
+    sqlite_optimize_interval: float = 3600.0  # seconds, 0 disables
+
+    # bulk endpoints
+    bulk_max_rows: int = 100_000
+    bulk_insert_chunk_size: int = 500  # rows per multi-row INSERT statement
+
+    # NDJSON export endpoints
+    export_chunk_size: int = 1000  # rows fetched from the server-side cursor and written to the response at once
+
+    # read-through cache of GET /cats/{cat_id} and GET /missions/{mission_id}, local to each worker
+    entity_cache_max_entries: int = 10_000  # 0 disables the cache
+    entity_cache_ttl: float = 30.0  # seconds, also bounds staleness of writes made by other workers
+
+    # outbound HTTP (TheCatAPI)
+    the_cat_api_url: str = 'https://api.thecatapi.com'
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0  # seconds an idle connection is kept in the pool
+    http2: bool = True
+    http_connect_timeout: float = 5.0
+    http_read_timeout: float = 10.0
+    http_write_timeout: float = 10.0
+    http_pool_timeout: float = 5.0  # seconds to wait for a free connection from the pool
+
+    # breed catalog
+    breed_catalog_ttl: float = 3600.0
+    breed_catalog_refresh_ahead: float = 300.0  # refresh this many seconds before the catalog expires
+    breed_catalog_retry_interval: float = 30.0
+    breed_catalog_snapshot_path: Path | None = Path('./breed_catalog.json')  # unset to keep the catalog in memory only
 
 
 config = Config()
@@ -4,3 +4,19 @@ from pydantic import BaseModel, Field
 class LimitOffsetImplPaginationParams(BaseModel):
     limit: int = Field(..., ge=1, le=100)
     offset: int = Field(..., ge=0)
+    with_total: bool = False
+
+
+class CursorPaginationParams(BaseModel):
+    limit: int = Field(..., ge=1, le=100)
+    after_id: int | None = Field(default=None, ge=0)  # None = first page
+    with_total: bool = False
+
+
+type PaginationParams = LimitOffsetImplPaginationParams | CursorPaginationParams
+
+
+class PageInfo(BaseModel):
+    has_next: bool
+    last_id: int | None = None
+    total_count: int | None = None  # only when asked for with `with_total`
@@ -0,0 +1,288 @@
+"""
+Load large datasets straight into the database, bypassing the HTTP API.
+
+Rows are streamed from JSONL or CSV files (one file per table, format picked by the file extension) or produced by
+a generator, validated and written with chunked `executemany` inside large transactions, so memory stays bounded by
+the chunk size. While loading, the connection relaxes SQLite durability (`synchronous=OFF`, no foreign key checks,
+no WAL auto-checkpoints) and secondary indexes are dropped; they are rebuilt, foreign keys verified and planner
+statistics refreshed at the end. The sources are checked before anything is dropped, and the indexes are rebuilt
+even when the load fails.
+
+Rows may carry an explicit `id`; targets reference their mission by `mission_id` and missions their cat by `cat_id`.
+Breeds are stored as given, they are not checked against TheCatAPI. A load is not atomic: transactions committed
+before an invalid row or a failed foreign key check stay in the database.
+
+    uv run python -m src.tools.seed --generate-cats 1000000 --generate-missions 500000
+    uv run python -m src.tools.seed --cats cats.csv --missions missions.jsonl --targets targets.jsonl
+"""
+
+import argparse
+import asyncio
+import contextlib
+import csv
+import json
+import logging
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Table, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.pool import NullPool
+
+from src.dependencies.db import create_db_engine
+from src.models import Mission, SpyCat, Target
+from src.schemas.cats import SpyCatCreateSchema
+from src.schemas.targets import TargetCreateSchema
+from src.settings import config
+
+
+logger = logging.getLogger(__name__)
+
+LOAD_PRAGMAS = (
+    'PRAGMA synchronous = OFF',
+    'PRAGMA foreign_keys = OFF',
+    'PRAGMA wal_autocheckpoint = 0',
+    'PRAGMA cache_size = -262144',
+    'PRAGMA temp_store = MEMORY',
+)
+TABLES = (SpyCat.__table__, Mission.__table__, Target.__table__)
+JSONL_SUFFIXES = ('.jsonl', '.ndjson')
+CSV_SUFFIXES = ('.csv',)
+
+
+class CatRow(SpyCatCreateSchema):
+    id: int | None = None
+
+
+class MissionRow(BaseModel):
+    id: int | None = None
+    completed: bool = False
+    cat_id: int | None = None
+
+
+class TargetRow(TargetCreateSchema):
+    id: int | None = None
+    mission_id: int
+
+
+class SeedError(Exception): ...
+
+
+def check_source(path: Path) -> None:
+    """Fail early, before any index is dropped, on a source file that cannot be read."""
+    if path.suffix not in JSONL_SUFFIXES + CSV_SUFFIXES:
+        raise SeedError(f'{path}: unsupported file type {path.suffix!r}, expected .jsonl, .ndjson or .csv')
+    if not path.is_file():
+        raise SeedError(f'{path}: no such file')
+
+
+def read_rows(path: Path) -> Iterator[dict]:
+    """Stream rows of a `.jsonl`/`.ndjson` or `.csv` file; empty CSV cells are read as missing values."""
+    with path.open(newline='') as file:
+        if path.suffix in JSONL_SUFFIXES:
+            for number, line in enumerate(file, start=1):
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as err:
+                        raise SeedError(f'{path}, line {number}: {err}') from err
+        else:
+            for row in csv.DictReader(file):
+                yield {key: value for key, value in row.items() if value != ''}
+
+
+def validate_rows(rows: Iterable[dict], schema: type[BaseModel], source: str) -> Iterator[dict]:
+    for number, row in enumerate(rows, start=1):
+        try:
+            yield schema.model_validate(row).model_dump()
+        except ValidationError as err:
+            raise SeedError(f'{source}, row {number}: {err}') from err
+
+
+def generate_cats(count: int, first_id: int) -> Iterator[dict]:
+    breeds = ('Abyssinian', 'Bengal', 'Siamese', 'Maine Coon', 'Sphynx', 'Ragdoll', 'Persian', 'Bombay')
+    for cat_id in range(first_id, first_id + count):
+        yield {
+            'id': cat_id,
+            'name': f'Cat {cat_id}',
+            'breed': breeds[cat_id % len(breeds)],
+            'salary': 1000.0 + cat_id % 5000,
+            'years_of_experience': cat_id % 20,
+        }
+
+
+def generate_missions(count: int, first_id: int, cat_ids: range) -> Iterator[dict]:
+    """Every third mission is completed; every other one of the rest goes to its own cat while cats last."""
+    for offset, mission_id in enumerate(range(first_id, first_id + count)):
+        completed = offset % 3 == 0
+        assigned = offset % 2 == 0 and offset < len(cat_ids)
+        yield {'id': mission_id, 'completed': completed, 'cat_id': cat_ids[offset] if assigned else None}
+
+
+def generate_targets(mission_ids: range, first_id: int) -> Iterator[dict]:
+    target_id = first_id
+    for offset, mission_id in enumerate(mission_ids):
+        completed_mission = offset % 3 == 0
+        for number in range(1 + offset % 3):
+            yield {
+                'id': target_id,
+                'mission_id': mission_id,
+                'name': f'Target {number + 1}',
+                'country': ('UA', 'PL', 'DE', 'FR')[target_id % 4],
+                'notes': None if target_id % 2 else f'Intel report {target_id}',
+                'completed': completed_mission or number == 0 and offset % 5 == 0,
+            }
+            target_id += 1
+
+
+async def drop_indexes(connection: AsyncConnection) -> list[str]:
+    """Drop secondary indexes of the seeded tables and return their DDL, unique constraints are kept."""
+    result = await connection.exec_driver_sql(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN (?, ?, ?)",
+        tuple(table.name for table in TABLES),
+    )
+    indexes = result.all()
+    for name, _ in indexes:
+        await connection.exec_driver_sql(f'DROP INDEX "{name}"')
+    await connection.commit()
+    return [sql for _, sql in indexes]
+
+
+async def restore_indexes(connection: AsyncConnection, index_ddl: list[str]) -> None:
+    """Recreate every dropped index that the loaded rows allow, then report the ones they violate."""
+    violated = []
+    for ddl in index_ddl:
+        try:
+            await connection.exec_driver_sql(ddl)
+        except IntegrityError as err:
+            violated.append(str(err.orig))
+    await connection.commit()
+    if violated:
+        raise SeedError(f'Loaded rows violate a unique index: {"; ".join(violated)}')
+
+
+async def load_table(connection: AsyncConnection, table: Table, rows: Iterable[dict], args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    loaded = in_transaction = 0
+    rows = iter(rows)
+    try:
+        while chunk := list(islice(rows, args.chunk_size)):
+            await connection.execute(insert(table), chunk)
+            loaded += len(chunk)
+            in_transaction += len(chunk)
+            if in_transaction >= args.transaction_rows:
+                await connection.commit()
+                in_transaction = 0
+        await connection.commit()
+    except OSError as err:
+        raise SeedError(f'{table.name}: cannot read rows: {err}') from err
+    except IntegrityError as err:
+        raise SeedError(f'{table.name}: rows violate a constraint: {err.orig}') from err
+
+    elapsed = time.perf_counter() - started
+    logger.info('%s: %d rows in %.1fs (%d rows/s)', table.name, loaded, elapsed, loaded / max(elapsed, 1e-9))
+    return loaded
+
+
+async def next_id(connection: AsyncConnection, table: Table) -> int:
+    return (await connection.scalar(select(func.coalesce(func.max(table.c.id), 0)))) + 1
+
+
+async def load(connection: AsyncConnection, files: tuple, report: dict, args: argparse.Namespace) -> None:
+    """Load the source files, then the generated rows; the row count of every table is added to `report`."""
+    for table, path, schema in files:
+        if path is None:
+            continue
+        rows = validate_rows(read_rows(path), schema, str(path))
+        report[table.name] = await load_table(connection, table, rows, args)
+
+    if args.generate_cats or args.generate_missions:
+        # generated ids continue after whatever is already in the tables
+        first_cat_id = await next_id(connection, SpyCat.__table__)
+        first_mission_id = await next_id(connection, Mission.__table__)
+        first_target_id = await next_id(connection, Target.__table__)
+        cat_ids = range(first_cat_id, first_cat_id + args.generate_cats)
+        mission_ids = range(first_mission_id, first_mission_id + args.generate_missions)
+        generated = (
+            (SpyCat.__table__, generate_cats(args.generate_cats, first_cat_id)),
+            (Mission.__table__, generate_missions(args.generate_missions, first_mission_id, cat_ids)),
+            (Target.__table__, generate_targets(mission_ids, first_target_id)),
+        )
+        for table, rows in generated:
+            report[table.name] = report.get(table.name, 0) + await load_table(connection, table, rows, args)
+
+
+async def seed(args: argparse.Namespace) -> dict:
+    files = (
+        (SpyCat.__table__, args.cats, CatRow),
+        (Mission.__table__, args.missions, MissionRow),
+        (Target.__table__, args.targets, TargetRow),
+    )
+    for _, path, _ in files:
+        if path is not None:
+            check_source(path)
+
+    engine = create_db_engine(args.db_url, poolclass=NullPool)
+    if engine.dialect.name != 'sqlite':
+        raise SeedError('Only SQLite databases are supported')
+
+    report = {}
+    started = time.perf_counter()
+    try:
+        async with engine.connect() as connection:
+            for pragma in LOAD_PRAGMAS:
+                await connection.exec_driver_sql(pragma)
+            index_ddl = [] if args.keep_indexes else await drop_indexes(connection)
+            try:
+                await load(connection, files, report, args)
+            except BaseException:
+                # a failed load must not leave the tables without their indexes, uq_missions_active_cat_id included;
+                # the load error is the one to report
+                await connection.rollback()
+                with contextlib.suppress(SeedError):
+                    await restore_indexes(connection, index_ddl)
+                raise
+            await restore_indexes(connection, index_ddl)
+
+            violations = (await connection.exec_driver_sql('PRAGMA foreign_key_check')).all()
+            await connection.exec_driver_sql('ANALYZE')
+            await connection.commit()
+            await connection.exec_driver_sql('PRAGMA wal_checkpoint(TRUNCATE)')
+    finally:
+        await engine.dispose()
+
+    if violations:
+        raise SeedError(f'{len(violations)} rows reference missing parents, e.g. {violations[0]}')
+    return {'rows': report, 'seconds': round(time.perf_counter() - started, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m src.tools.seed', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--db-url', default=config.db_url)
+    parser.add_argument('--cats', type=Path, help='cats to load (.jsonl, .ndjson or .csv)')
+    parser.add_argument('--missions', type=Path, help='missions to load (.jsonl, .ndjson or .csv)')
+    parser.add_argument('--targets', type=Path, help='targets to load (.jsonl, .ndjson or .csv)')
+    parser.add_argument('--generate-cats', type=int, default=0, help='number of synthetic cats')
+    parser.add_argument('--generate-missions', type=int, default=0, help='number of synthetic missions (1-3 targets)')
+    parser.add_argument('--chunk-size', type=int, default=10_000, help='rows per executemany call')
+    parser.add_argument('--transaction-rows', type=int, default=1_000_000, help='rows per committed transaction')
+    parser.add_argument('--keep-indexes', action='store_true', help='do not drop and rebuild secondary indexes')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    # every chunk is "slow", the per-table summary is what matters here
+    config.db_slow_query_threshold_ms = None
+    try:
+        report = asyncio.run(seed(args))
+    except SeedError as err:
+        sys.exit(f'error: {err}')
+    print(json.dumps(report))  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+import json
+from typing import Any, AsyncIterator
+
+from fastapi import Request
+from pydantic import BaseModel, ValidationError
+
+from src.errors.base import InvalidPayloadError
+
+
+NDJSON_MEDIA_TYPES = frozenset({'application/x-ndjson', 'application/ndjson', 'application/jsonl'})
+
+type BulkRow[T] = tuple[int, T | None, list[dict[str, Any]] | None]
+
+
+async def iter_bulk_rows[T: BaseModel](request: Request, schema: type[T], max_rows: int) -> AsyncIterator[BulkRow[T]]:
+    """
+    Validate the rows of a bulk request body one by one.
+
+    Accepts a JSON array or, with an NDJSON content type, one JSON object per line; NDJSON bodies are
+    consumed as a stream. Yields `(index, row, None)` for valid rows and `(index, None, errors)` for
+    invalid ones, so a bad row does not reject the whole batch.
+    """
+    media_type = request.headers.get('content-type', '').split(';')[0].strip().lower()
+    if media_type in NDJSON_MEDIA_TYPES:
+        rows = _iter_ndjson_rows(request, schema)
+    else:
+        rows = _iter_json_array_rows(request, schema, max_rows)
+
+    async for index, row, errors in rows:
+        if index >= max_rows:
+            raise InvalidPayloadError(f'Too many rows, at most {max_rows} are accepted per request')
+        yield index, row, errors
+
+
+async def _iter_json_array_rows[T: BaseModel](
+    request: Request, schema: type[T], max_rows: int
+) -> AsyncIterator[BulkRow[T]]:
+    try:
+        items = json.loads(await request.body())
+    except (json.JSONDecodeError, UnicodeDecodeError) as err:
+        raise InvalidPayloadError('Body must be a JSON array') from err
+    if not isinstance(items, list):
+        raise InvalidPayloadError('Body must be a JSON array')
+    # the whole array is parsed already, reject it before validating any row
+    if len(items) > max_rows:
+        raise InvalidPayloadError(f'Too many rows, at most {max_rows} are accepted per request')
+
+    for index, item in enumerate(items):
+        try:
+            yield index, schema.model_validate(item), None
+        except ValidationError as err:
+            yield index, None, err.errors(include_url=False, include_context=False)
+
+
+async def _iter_ndjson_rows[T: BaseModel](request: Request, schema: type[T]) -> AsyncIterator[BulkRow[T]]:
+    index = 0
+    buffer = b''
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b'\n')
+        for line in lines:
+            if line.strip():
+                yield _validate_line(index, line, schema)
+                index += 1
+    if buffer.strip():
+        yield _validate_line(index, buffer, schema)
+
+
+def _validate_line[T: BaseModel](index: int, line: bytes, schema: type[T]) -> BulkRow[T]:
+    try:
+        return index, schema.model_validate_json(line), None
+    except ValidationError as err:
+        errors = err.errors(include_url=False, include_context=False)
+        # a line that is not valid JSON comes back as raw bytes, which may not even be UTF-8
+        for error in errors:
+            if isinstance(error['input'], bytes):
+                error['input'] = error['input'].decode(errors='replace')
+        return index, None, errors
@@ -0,0 +1,46 @@
+import hashlib
+from http import HTTPStatus
+from typing import Iterable, Protocol
+
+from fastapi import Response
+
+
+ETAG_HEADER = 'ETag'
+# OpenAPI `responses` of endpoints answering conditional GETs
+NOT_MODIFIED_RESPONSES = {HTTPStatus.NOT_MODIFIED: {'description': 'Not modified, `If-None-Match` matches the ETag'}}
+
+
+class Versioned(Protocol):
+    id: int
+    version: int
+
+
+def version_etag(version: int) -> str:
+    return f'W/"{version}"'
+
+
+def page_etag(items: Iterable[Versioned], *extra: object) -> str:
+    """
+    Weak ETag of a list page: a digest of the (id, version) pairs of its items and anything else in the response
+    that is not derived from them (next page link, total count).
+    """
+    digest = hashlib.blake2b(digest_size=12)
+    for item in items:
+        digest.update(f'{item.id}:{item.version},'.encode())
+    for value in extra:
+        digest.update(f'|{value}'.encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an `If-None-Match` header against `etag`, as conditional GETs use it."""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    opaque_tag = etag.removeprefix('W/')
+    return any(candidate.strip().removeprefix('W/') == opaque_tag for candidate in if_none_match.split(','))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={ETAG_HEADER: etag})
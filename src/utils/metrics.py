@@ -0,0 +1,166 @@
+"""
+A small in-process metrics registry rendered in the Prometheus text exposition format.
+
+Metrics are plain counters kept in dicts keyed by label values, so recording one costs a dict lookup and an
+addition; everything else happens when `/metrics` is scraped.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+
+
+class Metric:
+    type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+    def _format_labels(self, values: tuple, extra: dict[str, str] | None = None) -> str:
+        pairs = list(zip(self.labels, values, strict=True))
+        if extra:
+            pairs.extend(extra.items())
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + '}'
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: defaultdict[tuple, float] = defaultdict(float)
+
+    def inc(self, *label_values, amount: float = 1) -> None:
+        self._values[label_values] += amount
+
+    def set(self, *label_values, value: float) -> None:
+        """Mirror a counter maintained by another component (e.g. the breed catalog stats)."""
+        self._values[label_values] = value
+
+    def render(self) -> list[str]:
+        return [f'{self.name}{self._format_labels(key)} {_format_value(value)}' for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    type = 'gauge'
+
+    def dec(self, *label_values, amount: float = 1) -> None:
+        self._values[label_values] -= amount
+
+
+class Histogram(Metric):
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = (), *, buckets: tuple[float, ...]):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: one (non-cumulative) count per bucket plus +Inf, then the sum
+        self._series: dict[tuple, list] = {}
+
+    def observe(self, *label_values, value: float) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self) -> list[str]:
+        lines = []
+        for key, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, '+Inf'), counts, strict=True):
+                cumulative += count
+                le = bound if isinstance(bound, str) else _format_value(bound)
+                lines.append(f'{self.name}_bucket{self._format_labels(key, {"le": le})} {cumulative}')
+            lines.append(f'{self.name}_sum{self._format_labels(key)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{self._format_labels(key)} {cumulative}')
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def register[M: Metric](self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f'Metric {metric.name} is already registered')
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 4, 5, 8, 13, 21, 50, 100)
+
+registry = Registry()
+
+http_request_duration_seconds = registry.register(
+    Histogram(
+        'http_request_duration_seconds',
+        'HTTP request latency by route template and status code',
+        ('method', 'route', 'status'),
+        buckets=LATENCY_BUCKETS,
+    )
+)
+http_requests_in_progress = registry.register(Gauge('http_requests_in_progress', 'HTTP requests being served'))
+http_request_db_queries = registry.register(
+    Histogram(
+        'http_request_db_queries',
+        'SQL statements executed per HTTP request',
+        ('method', 'route'),
+        buckets=QUERY_COUNT_BUCKETS,
+    )
+)
+http_request_db_duration_seconds = registry.register(
+    Histogram(
+        'http_request_db_duration_seconds',
+        'Time spent executing SQL statements per HTTP request',
+        ('method', 'route'),
+        buckets=LATENCY_BUCKETS,
+    )
+)
+db_pool_checkout_wait_seconds = registry.register(
+    Histogram(
+        'db_pool_checkout_wait_seconds',
+        'Time to check a connection out of the pool, including waiting for a free one',
+        ('pool',),
+        buckets=LATENCY_BUCKETS,
+    )
+)
+db_pool_checked_out_connections = registry.register(
+    Gauge('db_pool_checked_out_connections', 'Connections currently checked out of the pool', ('pool',))
+)
+breed_catalog_lookups_total = registry.register(
+    Counter('breed_catalog_lookups_total', 'Breed catalog lookups by result', ('result',))
+)
+breed_catalog_refreshes_total = registry.register(
+    Counter('breed_catalog_refreshes_total', 'Breed catalog refreshes against TheCatAPI by outcome', ('outcome',))
+)
+entity_cache_lookups_total = registry.register(
+    Counter('entity_cache_lookups_total', 'Entity cache lookups by namespace and result', ('namespace', 'result'))
+)
+entity_cache_evictions_total = registry.register(
+    Counter('entity_cache_evictions_total', 'Entity cache entries evicted to stay under the entry limit')
+)
+entity_cache_entries = registry.register(Gauge('entity_cache_entries', 'Entries held by the entity cache'))
@@ -0,0 +1,13 @@
+from typing import AsyncIterator
+
+import orjson
+
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
+
+async def iter_ndjson(chunks: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """Encode chunks of rows as NDJSON, one response body part per chunk."""
+    async for rows in chunks:
+        if rows:
+            yield b''.join(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows)
@@ -1,15 +1,48 @@
+import base64
+import binascii
+import json
+
 from fastapi import Request
 
-from src.structures import LimitOffsetImplPaginationParams
+from src.structures import CursorPaginationParams, PageInfo, PaginationParams
+
+
+TOTAL_COUNT_HEADER = 'X-Total-Count'
+
+
+def encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({'id': last_id}).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> int | None:
+    """Return the id to seek after, None for an empty cursor (first page). Raises ValueError if malformed."""
+    if not cursor:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as err:
+        raise ValueError('Malformed cursor') from err
+    if not isinstance(payload, dict) or type(payload.get('id')) is not int or payload['id'] < 0:
+        raise ValueError('Malformed cursor')
+    return payload['id']
 
 
 def build_next_url(
-    pagination_params: LimitOffsetImplPaginationParams, request: Request, total_count: int
+    pagination_params: PaginationParams,
+    request: Request,
+    page_info: PageInfo,
 ) -> str | None:
-    if pagination_params.offset + pagination_params.limit >= total_count:
+    if not page_info.has_next:
         return None
+    if isinstance(pagination_params, CursorPaginationParams):
+        return str(
+            request.url.remove_query_params('offset').include_query_params(
+                cursor=encode_cursor(page_info.last_id),
+                limit=pagination_params.limit,
+            )
+        )
     return str(
-        request.url.replace_query_params(
+        request.url.include_query_params(
             offset=pagination_params.offset + pagination_params.limit,
             limit=pagination_params.limit,
         )
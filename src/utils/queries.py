@@ -0,0 +1,103 @@
+import json
+import logging
+import re
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.settings import config
+
+
+slow_query_logger = logging.getLogger('src.slow_queries')
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_VALUES_LIST = re.compile(r'(\(\?\+\))(?:\s*,\s*\(\?\+\))+')
+_WHITESPACE = re.compile(r'\s+')
+
+
+class QueryStats(BaseModel):
+    count: int = 0
+    duration: float = 0.0
+    fingerprints: dict[str, int] = {}  # only collected while the query budget is enforced
+
+
+# set for the duration of a request by the metrics middleware
+current_query_stats: ContextVar[QueryStats | None] = ContextVar('current_query_stats', default=None)
+
+
+@lru_cache(maxsize=1024)
+def fingerprint_statement(statement: str) -> str:
+    """
+    Shape of a SQL statement: literals become `?` and placeholder lists of any length collapse into `(?+)`.
+
+    `WHERE id IN (?, ?)` and `WHERE id IN (?, ?, ?)`, or multi-row INSERTs of different sizes, share a fingerprint.
+    """
+    fingerprint = _STRING_LITERAL.sub('?', statement)
+    fingerprint = _NUMBER_LITERAL.sub('?', fingerprint)
+    fingerprint = _PLACEHOLDER_LIST.sub('(?+)', fingerprint)
+    fingerprint = _VALUES_LIST.sub(r'\1', fingerprint)
+    return _WHITESPACE.sub(' ', fingerprint).strip()
+
+
+def instrument_engine(db_engine: AsyncEngine) -> None:
+    """
+    Time every statement executed by `db_engine`, add it to the current request's `QueryStats`
+    and log the ones slower than the configured threshold.
+    """
+    event.listen(db_engine.sync_engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(db_engine.sync_engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ARG001
+    # kept on the statement's own execution context: after_cursor_execute never runs for a statement that raises,
+    # so a start time kept on the (pooled) connection would be left behind and paired with a later statement
+    if context is not None:
+        context.query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ARG001
+    started_at = getattr(context, 'query_started_at', None)
+    if started_at is None:
+        # the dialect's own statements run without an execution context
+        return
+    duration = time.perf_counter() - started_at
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += duration
+        if config.query_budget_mode != 'off':
+            fingerprint = fingerprint_statement(statement)
+            stats.fingerprints[fingerprint] = stats.fingerprints.get(fingerprint, 0) + 1
+
+    threshold = config.db_slow_query_threshold_ms
+    if threshold is None or duration * 1000 < threshold:
+        return
+
+    slow_query_logger.warning(
+        json.dumps(
+            {
+                'event': 'slow_query',
+                'fingerprint': fingerprint_statement(statement),
+                'duration_ms': round(duration * 1000, 3),
+                'rows': _row_count(cursor, context),
+                'executemany': executemany,
+            }
+        )
+    )
+
+
+def _row_count(cursor, context) -> int | None:
+    if cursor.description is None:
+        # DML without RETURNING
+        return cursor.rowcount if cursor.rowcount >= 0 else None
+    if context is not None and context.execution_options.get('stream_results'):
+        return None
+    # async drivers buffer the whole result before SQLAlchemy sees it, the DBAPI rowcount of a SELECT is -1
+    rows = getattr(cursor, '_rows', None)
+    return len(rows) if rows is not None else None
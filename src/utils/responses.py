@@ -0,0 +1,18 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic_core import to_jsonable_python
+
+
+class ModelResponse(ORJSONResponse):
+    """
+    JSON response for content that is already a validated schema (or plain JSON data).
+
+    Returning it from an endpoint bypasses the `response_model` round trip (validate again, dump to a dict, encode
+    with `jsonable_encoder`): models are dumped by pydantic-core and encoded by orjson in one pass. `response_model`
+    is still declared on the route for the OpenAPI schema, so the endpoint must return exactly that shape.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=to_jsonable_python)
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.settings import config
+
+
+logger = logging.getLogger(__name__)
+
+
+def to_read_only_url(db_url: str) -> str:
+    """The same SQLite database file opened with `mode=ro`; other URLs are returned unchanged."""
+    url = make_url(db_url)
+    if url.get_backend_name() != 'sqlite' or url.database in (None, '', ':memory:') or url.database.startswith('file:'):
+        return db_url
+    return url.set(
+        database=f'file:{url.database}',
+        query={**url.query, 'mode': 'ro', 'uri': 'true'},
+    ).render_as_string(hide_password=False)
+
+
+def get_sqlite_pragmas(*, read_only: bool = False) -> list[str]:
+    """Per-connection pragmas of the configured tuning profile."""
+    # the journal mode is stored in the database file, so only a writer may set it
+    pragmas = [] if read_only else [f'PRAGMA journal_mode = {config.sqlite_journal_mode}']
+    pragmas += [
+        f'PRAGMA synchronous = {config.sqlite_synchronous}',
+        f'PRAGMA busy_timeout = {config.sqlite_busy_timeout_ms}',
+        f'PRAGMA cache_size = {config.sqlite_cache_size}',
+        f'PRAGMA mmap_size = {config.sqlite_mmap_size}',
+        f'PRAGMA temp_store = {config.sqlite_temp_store}',
+        f'PRAGMA foreign_keys = {"ON" if config.sqlite_foreign_keys else "OFF"}',
+    ]
+    if read_only:
+        pragmas.append('PRAGMA query_only = ON')
+    return pragmas
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:  # noqa: ARG001
+    """`connect` event listener: apply the tuning profile to every new DBAPI connection."""
+    _execute_pragmas(dbapi_connection, get_sqlite_pragmas())
+
+
+def apply_sqlite_read_only_pragmas(dbapi_connection, connection_record) -> None:  # noqa: ARG001
+    """`connect` event listener for the read-only engine."""
+    _execute_pragmas(dbapi_connection, get_sqlite_pragmas(read_only=True))
+
+
+def _execute_pragmas(dbapi_connection, pragmas: list[str]) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in pragmas:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+async def run_sqlite_maintenance(engine: AsyncEngine) -> None:
+    """
+    Periodically checkpoint the WAL and refresh planner statistics with `PRAGMA optimize`.
+
+    Runs until cancelled; an interval of 0 disables the corresponding task.
+    """
+    tasks = []
+    if config.sqlite_wal_checkpoint_interval and config.sqlite_journal_mode == 'WAL':
+        pragma = f'PRAGMA wal_checkpoint({config.sqlite_wal_checkpoint_mode})'
+        tasks.append(_run_periodically(engine, pragma, config.sqlite_wal_checkpoint_interval))
+    if config.sqlite_optimize_interval:
+        tasks.append(_run_periodically(engine, 'PRAGMA optimize', config.sqlite_optimize_interval))
+    await asyncio.gather(*tasks)
+
+
+async def _run_periodically(engine: AsyncEngine, pragma: str, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text(pragma))
+        except Exception:
+            logger.exception('%s failed', pragma)